@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Set
 
 from ghostline.networking.hygiene import ProxyLeakSuite
 from ghostline.networking.tor import TorController
@@ -20,7 +20,7 @@ class PrivacyCIOrchestrator:
     regressions: List[str] = field(default_factory=list)
     last_diff: Dict[str, int] = field(default_factory=dict)
 
-    def run(self, uniformity_manager, containers: List[str], proxy_summary: Dict[str, bool]) -> Dict[str, object]:
+    def run(self, uniformity_manager, containers: Iterable[str], proxy_summary: Dict[str, bool]) -> Dict[str, object]:
         leak_results = self.proxy_suite.run(proxy_summary)
         audit_result = self.audit_suite.compare_uniformity(uniformity_manager, containers)
         tor_health = self.tor_controller.health_summary()
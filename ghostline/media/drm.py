@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Tuple
 
 _USE_FAKE_QT = os.environ.get("GHOSTLINE_FAKE_QT", "0") == "1"
 
@@ -54,13 +55,25 @@ def find_widevine_library(extra_paths: Iterable[str] | None = None) -> Optional[
 
     search_roots = os.environ.get("WIDEVINE_SEARCH_ROOTS")
     if search_roots:
-        roots = [Path(p) for p in search_roots.split(os.pathsep) if p]
+        roots = tuple(p for p in search_roots.split(os.pathsep) if p)
     else:
-        roots = [root for root in _DEFAULT_SEARCH_ROOTS if root.exists()]
+        roots = tuple(str(root) for root in _DEFAULT_SEARCH_ROOTS if root.exists())
+    return _scan_search_roots(roots)
+
+
+@lru_cache(maxsize=8)
+def _scan_search_roots(roots: Tuple[str, ...]) -> Optional[str]:
+    """Walk ``roots`` for the Widevine library; each distinct root set is walked once.
+
+    The recursive walk over the home directory and system library trees is
+    the slow part of discovery, so its result (including a miss) is reused.
+    Call ``_scan_search_roots.cache_clear()`` to pick up a library installed
+    since the first scan.
+    """
 
     for root in roots:
         try:
-            for match in root.rglob("libwidevinecdm.so"):
+            for match in Path(root).rglob("libwidevinecdm.so"):
                 return str(match)
         except PermissionError:
             continue
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from ghostline.privacy.uniformity import UniformityManager, UniformityProfile
 
@@ -17,21 +17,25 @@ class AuditResult:
 class FingerprintingAuditSuite:
     """Compares uniformity across containers and profiles."""
 
-    def compare_uniformity(self, manager: UniformityManager, containers: List[str]) -> AuditResult:
-        if not containers:
-            raise ValueError("no-containers")
-        baseline = manager.profile_for(containers[0])
+    def compare_uniformity(self, manager: UniformityManager, containers: Iterable[str]) -> AuditResult:
+        # The first container is the baseline; a single pass accepts any
+        # iterable, such as a dict keys view, without copying it to a list.
+        baseline: UniformityProfile | None = None
         delta: Dict[str, int] = {}
         consistent = True
         notes: List[str] = []
 
         for container in containers:
             profile = manager.profile_for(container)
+            if baseline is None:
+                baseline = profile
             diff = self._diff_profiles(baseline, profile)
             delta[container] = diff
             if diff != 0:
                 consistent = False
                 notes.append(f"delta:{container}:{diff}")
+        if baseline is None:
+            raise ValueError("no-containers")
         return AuditResult(uniformity_delta=delta, consistent=consistent, notes=notes)
 
     def _diff_profiles(self, baseline: UniformityProfile, other: UniformityProfile) -> int:
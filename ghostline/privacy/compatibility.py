@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from typing import Iterable, Optional
 from urllib.parse import urlparse
 
+from ghostline.privacy.host_trie import HostSuffixTrie
+
 
 @dataclass(frozen=True)
 class CompatibilityAdvisory:
@@ -24,16 +26,14 @@ class StreamingCompatibilityAdvisor:
 
     def __init__(self, advisories: Optional[Iterable[CompatibilityAdvisory]] = None) -> None:
         self._advisories = tuple(advisories) if advisories else self._default_advisories()
+        # Same first-match order as scanning _advisories, in one walk per host.
+        self._by_host = HostSuffixTrie((advisory.host, advisory) for advisory in self._advisories)
 
     def advisory_for(self, host_or_url: str) -> Optional[CompatibilityAdvisory]:
         host = self._normalize_host(host_or_url)
         if not host:
             return None
-
-        for advisory in self._advisories:
-            if advisory.matches(host):
-                return advisory
-        return None
+        return self._by_host.match(host)
 
     @staticmethod
     def _normalize_host(value: str) -> Optional[str]:
@@ -129,7 +129,7 @@ class DeviceRandomizer:
         return screen
 
 
-@dataclass
+@dataclass(slots=True)
 class NoiseCalibrator:
     """Generates deterministic canvas and audio noise with calibrated amplitude."""
 
@@ -0,0 +1,65 @@
+"""Reversed-label trie for matching hosts against domain suffixes."""
+from __future__ import annotations
+
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Node key holding a stored domain's entry; labels are always strings.
+_TERMINAL = None
+
+
+class HostSuffixTrie(Generic[T]):
+    """Maps domains to values; a host matches a domain or any of its subdomains.
+
+    Hosts are split on ``.`` and walked from the top-level label inwards, so a
+    lookup costs one dict hop per label no matter how many domains are stored.
+    When several stored domains match, the earliest inserted one wins, the
+    same answer a linear first-match scan over the entries would give. Labels
+    compare exactly, so callers pass lowercased hosts.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self, entries: Iterable[Tuple[str, T]] = ()) -> None:
+        self._root: Dict[Any, Any] = {}
+        self._count = 0
+        for domain, value in entries:
+            self.insert(domain, value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, host: str) -> bool:
+        return self._entry(host) is not None
+
+    def insert(self, domain: str, value: T) -> None:
+        """Store ``value`` for ``domain``; re-inserting a domain keeps the first value."""
+
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        if _TERMINAL not in node:
+            node[_TERMINAL] = (self._count, value)
+            self._count += 1
+
+    def match(self, host: str) -> Optional[T]:
+        """Return the value of the earliest-inserted domain that ``host`` falls under."""
+
+        entry = self._entry(host)
+        return None if entry is None else entry[1]
+
+    def _entry(self, host: str) -> Optional[Tuple[int, T]]:
+        node = self._root
+        best: Optional[Tuple[int, T]] = None
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            entry = node.get(_TERMINAL)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        return best
+
+
+__all__ = ["HostSuffixTrie"]
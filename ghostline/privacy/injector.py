@@ -7,7 +7,8 @@ DocumentCreation time using QtWebEngine's QWebEngineScript system.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Any
+import sys
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Tuple
 
 if TYPE_CHECKING:
     from ghostline.ui.dashboard import PrivacyDashboard
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 class NavigatorSpoofGenerator:
     """Generates JavaScript to spoof navigator properties."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(device: Dict[str, str | int], user_agent: str) -> str:
         """Generate navigator spoofing JavaScript.
@@ -111,6 +114,8 @@ class NavigatorSpoofGenerator:
 class PluginsAndMimeTypesSpoofGenerator:
     """Generates JavaScript to spoof navigator.plugins and navigator.mimeTypes."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate() -> str:
         """Generate plugins and mimeTypes spoofing JavaScript.
@@ -159,6 +164,8 @@ class PluginsAndMimeTypesSpoofGenerator:
 class UserAgentDataSpoofGenerator:
     """Generates JavaScript to spoof navigator.userAgentData (Client Hints API)."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(platform: str) -> str:
         """Generate userAgentData spoofing JavaScript.
@@ -216,6 +223,8 @@ class CanvasNoiseGenerator:
     Each getImageData() call returns random pixels for the area.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def generate(noise: Dict[str, float]) -> str:
         """Generate canvas noise injection JavaScript.
@@ -239,37 +248,32 @@ class CanvasNoiseGenerator:
   const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
   CanvasRenderingContext2D.prototype.getImageData = function(...args) {{
     const imageData = originalGetImageData.apply(this, args);
+    const data = imageData.data;
 
     // Apply aggressive noise: base value + full random noise
     const baseNoise = {{r: {r_noise}, g: {g_noise}, b: {b_noise}, a: {a_noise}}};
-
-    // Add pure random noise to every pixel (full range: 0-255)
-    for (let i = 0; i < imageData.data.length; i += 4) {{
+    const rBase = baseNoise.r * 255;
+    const gBase = baseNoise.g * 255;
+    const bBase = baseNoise.b * 255;
+    const aBase = baseNoise.a * 255;
+
+    // Add pure random noise to every pixel (full range: 0-255). Clamp with
+    // inline ternaries instead of two builtin min/max calls per channel.
+    let v;
+    for (let i = 0; i < data.length; i += 4) {{
       // Random noise: ±255 per channel (completely randomize)
-      const rRand = Math.random() * 510 - 255;
-      const gRand = Math.random() * 510 - 255;
-      const bRand = Math.random() * 510 - 255;
-      const aRand = Math.random() * 510 - 255;
-
-      imageData.data[i] = Math.max(0, Math.min(255, imageData.data[i] + baseNoise.r * 255 + rRand));       // R
-      imageData.data[i+1] = Math.max(0, Math.min(255, imageData.data[i+1] + baseNoise.g * 255 + gRand));   // G
-      imageData.data[i+2] = Math.max(0, Math.min(255, imageData.data[i+2] + baseNoise.b * 255 + bRand));   // B
-      imageData.data[i+3] = Math.max(0, Math.min(255, imageData.data[i+3] + baseNoise.a * 255 + aRand));   // A
+      v = data[i] + rBase + (Math.random() * 510 - 255);       // R
+      data[i] = v < 0 ? 0 : (v > 255 ? 255 : v);
+      v = data[i+1] + gBase + (Math.random() * 510 - 255);     // G
+      data[i+1] = v < 0 ? 0 : (v > 255 ? 255 : v);
+      v = data[i+2] + bBase + (Math.random() * 510 - 255);     // B
+      data[i+2] = v < 0 ? 0 : (v > 255 ? 255 : v);
+      v = data[i+3] + aBase + (Math.random() * 510 - 255);     // A
+      data[i+3] = v < 0 ? 0 : (v > 255 ? 255 : v);
     }}
 
     return imageData;
   }};
-
-  // Also wrap toDataURL and toBlob for completeness
-  const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-  HTMLCanvasElement.prototype.toDataURL = function(...args) {{
-    return originalToDataURL.apply(this, args);
-  }};
-
-  const originalToBlob = HTMLCanvasElement.prototype.toBlob;
-  HTMLCanvasElement.prototype.toBlob = function(...args) {{
-    return originalToBlob.apply(this, args);
-  }};
 """
         return js_code
 
@@ -277,6 +281,8 @@ class CanvasNoiseGenerator:
 class WebGLSpoofGenerator:
     """Generates JavaScript to spoof WebGL parameters."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(gpu: str) -> str:
         """Generate WebGL spoofing JavaScript.
@@ -328,29 +334,13 @@ class WebGLSpoofGenerator:
         return js_code
 
 
-class APIGateGenerator:
-    """Generates JavaScript to block high-entropy APIs based on uniformity settings."""
-
-    @staticmethod
-    def generate(gating: Dict[str, bool]) -> str:
-        """Generate API gating JavaScript.
-
-        Args:
-            gating: Dictionary mapping API names to allowed status
-                   (True = allowed, False = blocked)
-
-        Returns:
-            JavaScript code that blocks disallowed APIs
-        """
-        js_parts = ["""
+_API_GATE_HEADER_JS = """
   // ═══════════════════════════════════════════════════════
   // HIGH-ENTROPY API GATING
   // ═══════════════════════════════════════════════════════
-"""]
+"""
 
-        # Block WebGL if not allowed
-        if not gating.get('webgl', True):
-            js_parts.append("""
+_BLOCK_WEBGL_JS = """
   // Block WebGL
   const originalGetContext = HTMLCanvasElement.prototype.getContext;
   HTMLCanvasElement.prototype.getContext = function(contextType, ...args) {
@@ -360,11 +350,9 @@ class APIGateGenerator:
     }
     return originalGetContext.apply(this, [contextType, ...args]);
   };
-""")
+"""
 
-        # Block WebGPU if not allowed
-        if not gating.get('webgpu', True):
-            js_parts.append("""
+_BLOCK_WEBGPU_JS = """
   // Block WebGPU
   // navigator.gpu is force-disabled to reduce entropy surface
   const originalWebGPU = navigator.gpu;
@@ -377,19 +365,15 @@ class APIGateGenerator:
   // Preserve property visibility while ensuring callers receive undefined
   // without triggering assignment errors on accessor-only properties
   void originalWebGPU;
-""")
+"""
 
-        # Block AudioContext if not allowed
-        if not gating.get('audiocontext', True):
-            js_parts.append("""
+_BLOCK_AUDIOCONTEXT_JS = """
   // Block AudioContext
   window.AudioContext = undefined;
   window.webkitAudioContext = undefined;
-""")
+"""
 
-        # Block Gamepad API if not allowed
-        if not gating.get('gamepad', True):
-            js_parts.append("""
+_BLOCK_GAMEPAD_JS = """
   // Block Gamepad API
   Object.defineProperty(navigator, 'getGamepads', {
     get: () => () => [],
@@ -399,25 +383,53 @@ class APIGateGenerator:
 
   window.addEventListener('gamepadconnected', (e) => e.stopImmediatePropagation(), true);
   window.addEventListener('gamepaddisconnected', (e) => e.stopImmediatePropagation(), true);
-""")
+"""
 
-        # Block Battery API if not allowed
-        if not gating.get('battery', True):
-            js_parts.append("""
+_BLOCK_BATTERY_JS = """
   // Block Battery API
   if (navigator.getBattery) {
     navigator.getBattery = function() {
       return Promise.reject(new Error('Battery API is not available'));
     };
   }
-""")
+"""
+
+# Emission order matters: later fragments may rely on earlier overrides.
+_API_BLOCK_FRAGMENTS = (
+    ('webgl', _BLOCK_WEBGL_JS),
+    ('webgpu', _BLOCK_WEBGPU_JS),
+    ('audiocontext', _BLOCK_AUDIOCONTEXT_JS),
+    ('gamepad', _BLOCK_GAMEPAD_JS),
+    ('battery', _BLOCK_BATTERY_JS),
+)
+
+
+class APIGateGenerator:
+    """Generates JavaScript to block high-entropy APIs based on uniformity settings."""
+
+    __slots__ = ()
 
-        return "".join(js_parts)
+    @staticmethod
+    def generate(gating: Dict[str, bool]) -> str:
+        """Generate API gating JavaScript.
+
+        Args:
+            gating: Dictionary mapping API names to allowed status
+                   (True = allowed, False = blocked)
+
+        Returns:
+            JavaScript code that blocks disallowed APIs
+        """
+        return _API_GATE_HEADER_JS + "".join(
+            js for api, js in _API_BLOCK_FRAGMENTS if not gating.get(api, True)
+        )
 
 
 class TimerJitterGenerator:
     """Generates JavaScript to reduce timer granularity."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(granularity_ms: int = 100) -> str:
         """Generate timer jitter JavaScript.
@@ -434,19 +446,19 @@ class TimerJitterGenerator:
   // ═══════════════════════════════════════════════════════
 
   const GRANULARITY_MS = {granularity_ms};
+  // Math.floor rather than |0: epoch milliseconds overflow int32.
+  const quantize = (now) => Math.floor(now / GRANULARITY_MS) * GRANULARITY_MS;
 
   // Date.now()
   const originalDateNow = Date.now;
   Date.now = function() {{
-    const now = originalDateNow();
-    return Math.floor(now / GRANULARITY_MS) * GRANULARITY_MS;
+    return quantize(originalDateNow());
   }};
 
   // performance.now()
   const originalPerformanceNow = performance.now;
   performance.now = function() {{
-    const now = originalPerformanceNow.call(this);
-    return Math.floor(now / GRANULARITY_MS) * GRANULARITY_MS;
+    return quantize(originalPerformanceNow.call(this));
   }};
 
   // Date constructor
@@ -454,17 +466,13 @@ class TimerJitterGenerator:
   Date = new Proxy(OriginalDateConstructor, {{
     construct(target, args) {{
       if (args.length === 0) {{
-        const now = originalDateNow();
-        const rounded = Math.floor(now / GRANULARITY_MS) * GRANULARITY_MS;
-        return new target(rounded);
+        return new target(quantize(originalDateNow()));
       }}
       return new target(...args);
     }},
     apply(target, thisArg, args) {{
       if (args.length === 0) {{
-        const now = originalDateNow();
-        const rounded = Math.floor(now / GRANULARITY_MS) * GRANULARITY_MS;
-        return new target(rounded).toString();
+        return new target(quantize(originalDateNow())).toString();
       }}
       return new target(...args).toString();
     }}
@@ -481,6 +489,8 @@ class TimerJitterGenerator:
 class AudioNoiseGenerator:
     """Generates JavaScript to inject noise into AudioContext."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(noise: float) -> str:
         """Generate audio noise injection JavaScript.
@@ -532,6 +542,8 @@ class AudioNoiseGenerator:
 class TimezoneSpoofGenerator:
     """Generates JavaScript to spoof timezone to UTC."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(spoof_enabled: bool = True) -> str:
         """Generate timezone spoofing JavaScript.
@@ -614,6 +626,8 @@ class TimezoneSpoofGenerator:
 class ScreenDimensionSpoofGenerator:
     """Generates JavaScript to spoof screen dimensions with bucketing."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(screen_config: Dict[str, int]) -> str:
         """Generate screen dimension spoofing JavaScript.
@@ -686,6 +700,8 @@ class ScreenDimensionSpoofGenerator:
 class LanguageSpoofGenerator:
     """Generates JavaScript to spoof language settings."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(locale: str = "en-US") -> str:
         """Generate language spoofing JavaScript.
@@ -719,6 +735,8 @@ class LanguageSpoofGenerator:
 class MediaDevicesSpoofGenerator:
     """Generates JavaScript to spoof media devices enumeration."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate(block_enumeration: bool = False) -> str:
         """Generate media devices spoofing JavaScript.
@@ -757,6 +775,26 @@ class MediaDevicesSpoofGenerator:
 class FingerprintInjector:
     """Main orchestrator for generating anti-fingerprinting JavaScript."""
 
+    __slots__ = ('dashboard', 'container')
+
+    # Ordered protection modules paired with the config keys passed to them
+    # positionally. Built once so generate_script() stays data-driven.
+    _PIPELINE: ClassVar[Tuple[Tuple[Callable[..., str], Tuple[str, ...]], ...]] = (
+        (NavigatorSpoofGenerator.generate, ('device', 'user_agent')),
+        (UserAgentDataSpoofGenerator.generate, ('platform',)),
+        (PluginsAndMimeTypesSpoofGenerator.generate, ()),
+        (LanguageSpoofGenerator.generate, ('locale',)),
+        (ScreenDimensionSpoofGenerator.generate, ('screen',)),
+        (TimezoneSpoofGenerator.generate, ()),
+        (CanvasNoiseGenerator.generate, ('canvas_noise',)),
+        (WebGLSpoofGenerator.generate, ('gpu',)),
+        (APIGateGenerator.generate, ('gating',)),
+        (TimerJitterGenerator.generate, ()),
+        (AudioNoiseGenerator.generate, ('audio_noise',)),
+        # Media devices protection (strict mode blocks enumeration, balanced returns generic)
+        (MediaDevicesSpoofGenerator.generate, ('strict_mode',)),
+    )
+
     def __init__(self, dashboard: PrivacyDashboard, container: str) -> None:
         """Initialize the fingerprint injector.
 
@@ -765,7 +803,9 @@ class FingerprintInjector:
             container: Container name to generate protections for
         """
         self.dashboard = dashboard
-        self.container = container
+        # Container names key every dashboard lookup; interning lets those
+        # dict probes short-circuit on identity.
+        self.container = sys.intern(container)
 
     def generate_script(self, origin: str) -> str:
         """Generate complete anti-fingerprinting JavaScript for an origin.
@@ -776,19 +816,24 @@ class FingerprintInjector:
         Returns:
             Complete JavaScript code to inject
         """
+        prologue, epilogue = self.compile_template()
+        return prologue + origin + epilogue
+
+    def compile_template(self) -> Tuple[str, str]:
+        """Render the script around the origin slot in its header comment.
+
+        The protection body depends on the container's dashboard state, not on
+        the ``origin`` argument; :meth:`template_key` identifies that state, so
+        a template is reusable for as long as the key is unchanged.
+
+        Returns:
+            ``(prologue, epilogue)``; the script is ``prologue + origin + epilogue``
+        """
         # Get configuration from dashboard
         config = self._get_config()
 
-        device = config['device']
-        noise = config['noise']
-        gating = config['gating']
-        user_agent = config['user_agent']
-        platform = config.get('platform', 'Linux')
-        locale = config.get('locale', 'en-US')
-        screen_config = config.get('screen', {})
-
         # Generate header
-        preset = self.dashboard.uniformity_manager.profile_for(self.container).name
+        preset = config['preset']
 
         script_parts = [
             "(function() {",
@@ -796,27 +841,19 @@ class FingerprintInjector:
             "",
             "  // ═══════════════════════════════════════════════════════",
             "  // GHOSTLINE BROWSER ANTI-FINGERPRINTING PROTECTION",
-            f"  // Container: {self.container} | Preset: {preset} | Origin: {origin}",
+            f"  // Container: {self.container} | Preset: {preset} | Origin: ",
+        ]
+        prologue = "\n".join(script_parts)
+
+        script_parts = [
+            "",
             "  // ═══════════════════════════════════════════════════════",
             ""
         ]
 
         # Add all protection modules
-        script_parts.append(NavigatorSpoofGenerator.generate(device, user_agent))
-        script_parts.append(UserAgentDataSpoofGenerator.generate(platform))
-        script_parts.append(PluginsAndMimeTypesSpoofGenerator.generate())
-        script_parts.append(LanguageSpoofGenerator.generate(locale))
-        script_parts.append(ScreenDimensionSpoofGenerator.generate(screen_config))
-        script_parts.append(TimezoneSpoofGenerator.generate(spoof_enabled=True))
-        script_parts.append(CanvasNoiseGenerator.generate(noise['canvas']))
-        script_parts.append(WebGLSpoofGenerator.generate(str(device.get('gpu', 'Ghostline GPU'))))
-        script_parts.append(APIGateGenerator.generate(gating))
-        script_parts.append(TimerJitterGenerator.generate(100))
-        script_parts.append(AudioNoiseGenerator.generate(noise['audio']))
-
-        # Media devices protection (strict mode blocks enumeration, balanced returns generic)
-        strict_mode = self.dashboard.uniformity_manager.profile_for(self.container).strict_mode
-        script_parts.append(MediaDevicesSpoofGenerator.generate(block_enumeration=strict_mode))
+        for generator, keys in self._PIPELINE:
+            script_parts.append(generator(*[config[key] for key in keys]))
 
         # Add footer
         script_parts.extend([
@@ -827,17 +864,28 @@ class FingerprintInjector:
             "})();"
         ])
 
-        return "\n".join(script_parts)
+        return prologue, "\n".join(script_parts)
+
+    def template_key(self) -> Tuple[str, str, str, str]:
+        """Key identifying the dashboard state ``compile_template`` renders.
+
+        Returns:
+            ``(container, origin, preset, locale)``; the device, noise and screen
+            values all derive from the origin, gating from the preset
+        """
+        origin = self.dashboard.origin_for_container(self.container)
+        return (self.container, origin, *self.dashboard.fingerprint_state_for(self.container))
 
     def _get_config(self) -> Dict[str, Any]:
         """Get injection configuration from dashboard.
 
         Returns:
-            Dictionary with device, noise, gating, user_agent, locale, and screen
+            Dictionary with device, noise, gating, user_agent, locale, screen,
+            preset, and the derived per-generator keys consumed by ``_PIPELINE``
         """
         from ghostline.privacy.rfp import unified_user_agent
 
-        origin = self.dashboard._container_origins.get(self.container, "about:blank")
+        origin = self.dashboard.origin_for_container(self.container)
         device = self.dashboard._last_device_class.get(self.container, {
             'platform': 'Linux',
             'memory_gb': 8,
@@ -855,6 +903,8 @@ class FingerprintInjector:
         platform = str(device.get('platform', 'Linux'))
         user_agent = unified_user_agent(platform=platform + " x86_64")
 
+        profile = self.dashboard.uniformity_manager.profile_for(self.container)
+
         return {
             'device': device,
             'noise': noise,
@@ -864,6 +914,11 @@ class FingerprintInjector:
             'platform': platform,
             'locale': locale,
             'screen': screen_config,
+            'canvas_noise': noise['canvas'],
+            'audio_noise': noise['audio'],
+            'gpu': str(device.get('gpu', 'Ghostline GPU')),
+            'preset': sys.intern(profile.name),
+            'strict_mode': profile.strict_mode,
         }
 
 
@@ -19,7 +19,7 @@ def rounded_time(now: float | None = None) -> float:
     return bucket
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasNoiseInjector:
     """Generates deterministic per-origin noise for canvas-like APIs."""
 
@@ -1,11 +1,13 @@
 """Uniformity profiles and high-entropy API gating."""
 from __future__ import annotations
 
+from collections import ChainMap
 from dataclasses import dataclass, field
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping
 
 
-HIGH_ENTROPY_APIS = {"webgl", "webgpu", "audiocontext", "gamepad", "battery"}
+HIGH_ENTROPY_APIS = frozenset({"webgl", "webgpu", "audiocontext", "gamepad", "battery"})
 
 
 @dataclass
@@ -13,7 +15,7 @@ class FontPack:
     """Locale-aware font packs with per-site overrides."""
 
     name: str
-    locales: Dict[str, List[str]]
+    locales: Mapping[str, List[str]]
     site_overrides: Dict[str, List[str]] = field(default_factory=dict)
 
     def fonts_for(self, locale: str, site: str | None = None) -> List[str]:
@@ -30,14 +32,18 @@ class UniformityProfile:
     """Represents a set of capability masks and font normalization."""
 
     name: str
-    capability_mask: Dict[str, bool]
+    capability_mask: Mapping[str, bool]
     font_pack: FontPack
     strict_mode: bool = False
+    _blocked: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Fold strict mode and the mask into one set so gating is a single probe.
+        blocked = frozenset(api for api, allowed in self.capability_mask.items() if not allowed)
+        self._blocked = blocked | HIGH_ENTROPY_APIS if self.strict_mode else blocked
 
     def gate_api(self, api: str) -> bool:
-        if self.strict_mode and api in HIGH_ENTROPY_APIS:
-            return False
-        return self.capability_mask.get(api, True)
+        return api not in self._blocked
 
 
 class UniformityManager:
@@ -48,22 +54,23 @@ class UniformityManager:
         self.container_profiles: Dict[str, UniformityProfile] = {}
 
     def _build_presets(self) -> Dict[str, UniformityProfile]:
+        # Preset masks and locales are read-only so containers can share them.
         base_fonts = FontPack(
             name="baseline",
-            locales={
+            locales=MappingProxyType({
                 "default": ["Inter", "Noto Sans", "DejaVu Sans"],
                 "en-US": ["Inter", "Roboto", "Noto Sans"],
                 "fr-FR": ["Inter", "Noto Sans", "Liberation Sans"],
-            },
+            }),
         )
-        strict_mask = {api: False for api in HIGH_ENTROPY_APIS}
-        balanced_mask = {
+        strict_mask = MappingProxyType({api: False for api in HIGH_ENTROPY_APIS})
+        balanced_mask = MappingProxyType({
             "webgl": True,
             "webgpu": False,
             "audiocontext": True,
             "gamepad": True,
-        }
-        compat_mask = {api: True for api in HIGH_ENTROPY_APIS}
+        })
+        compat_mask = MappingProxyType({api: True for api in HIGH_ENTROPY_APIS})
 
         return {
             "strict": UniformityProfile(
@@ -90,15 +97,17 @@ class UniformityManager:
         if preset not in self.presets:
             raise ValueError(f"unknown-preset:{preset}")
         profile = self.presets[preset]
-        # Clone a profile so per-container overrides don't leak
+        # Preset masks and locales are read-only, so the per-container profile
+        # shares them; only the locale default and site overrides are its own.
+        locales = profile.font_pack.locales
+        if locale not in locales:
+            locales = ChainMap({locale: locales.get("default", [])}, locales)
         cloned = UniformityProfile(
             name=profile.name,
-            capability_mask=dict(profile.capability_mask),
-            font_pack=FontPack(profile.font_pack.name, dict(profile.font_pack.locales), dict(profile.font_pack.site_overrides)),
+            capability_mask=profile.capability_mask,
+            font_pack=FontPack(profile.font_pack.name, locales, dict(profile.font_pack.site_overrides)),
             strict_mode=profile.strict_mode,
         )
-        # Ensure locale defaults exist
-        cloned.font_pack.locales.setdefault(locale, cloned.font_pack.locales.get("default", []))
         self.container_profiles[container] = cloned
         return cloned
 
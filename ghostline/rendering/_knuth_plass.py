@@ -0,0 +1,112 @@
+"""Optimal-fit line breaking for wrapped block text.
+
+A boxes-and-glue subset of Knuth-Plass (no hyphenation or stretchable glue):
+a paragraph costs the sum of squared trailing slack over every line but the
+last, so breaks favour evenly filled lines over greedy first-fit. Long
+paragraphs first run a cheap approximate pass that treats line width as the
+sum of per-word widths (prefix sums, O(1) per candidate line); its cost is an
+upper bound for the exact pass, which measures whole lines and skips any
+candidate already over the bound before measuring it.
+"""
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Paragraphs with at most this many words go straight to the exact pass.
+APPROXIMATE_THRESHOLD = 64
+# A word wider than the measure gets a line of its own at a steep cost.
+OVERFULL_PENALTY = 10**9
+
+Measure = Callable[[str], int]
+
+
+def _line_cost(width: int, max_width: int, last: bool) -> int:
+    slack = max_width - width
+    if slack < 0:
+        return OVERFULL_PENALTY + slack * slack
+    return 0 if last else slack * slack
+
+
+def _line_ends(previous: List[int], count: int) -> List[int]:
+    ends: List[int] = []
+    end = count
+    while end > 0:
+        ends.append(end)
+        end = previous[end]
+    ends.reverse()
+    return ends
+
+
+def linebreak_optimized_approximate(words: Sequence[str], max_width: int, measure: Measure) -> Tuple[List[int], int]:
+    """Break ``words`` assuming widths are additive; return ``(line ends, cost)``."""
+
+    count = len(words)
+    space = measure(" ")
+    prefix = [0]
+    for word in words:
+        prefix.append(prefix[-1] + measure(word))
+
+    cost = [0] * (count + 1)
+    previous = [0] * (count + 1)
+    for end in range(1, count + 1):
+        best = -1
+        for start in range(end - 1, -1, -1):
+            width = prefix[end] - prefix[start] + space * (end - start - 1)
+            if width > max_width and end - start > 1:
+                break
+            total = cost[start] + _line_cost(width, max_width, end == count)
+            if best < 0 or total < best:
+                best = total
+                previous[end] = start
+        cost[end] = best
+    return _line_ends(previous, count), cost[count]
+
+
+def linebreak_optimized_bounded(
+    words: Sequence[str], max_width: int, measure: Measure, bound: Optional[int] = None
+) -> Optional[List[int]]:
+    """Break ``words`` measuring whole lines, pruning paths costlier than ``bound``.
+
+    Returns ``None`` when no break sequence stays within ``bound``.
+    """
+
+    count = len(words)
+    cost: List[Optional[int]] = [0] + [None] * count
+    previous = [0] * (count + 1)
+    first = 0  # earliest start whose line can still fit; only moves forward
+    for end in range(1, count + 1):
+        while end - first > 1 and measure(" ".join(words[first:end])) > max_width:
+            first += 1
+        best: Optional[int] = None
+        for start in range(first, end):
+            base = cost[start]
+            if base is None or (bound is not None and base > bound):
+                continue  # pruned before paying for a measurement
+            width = measure(" ".join(words[start:end]))
+            total = base + _line_cost(width, max_width, end == count)
+            if bound is not None and total > bound:
+                continue
+            if best is None or total < best:
+                best = total
+                previous[end] = start
+        cost[end] = best
+    if cost[count] is None:
+        return None
+    return _line_ends(previous, count)
+
+
+def break_lines(words: Sequence[str], max_width: int, measure: Measure) -> List[str]:
+    """Return the optimal-fit lines for ``words`` within ``max_width``."""
+
+    if not words:
+        return []
+    ends: Optional[List[int]] = None
+    if len(words) > APPROXIMATE_THRESHOLD:
+        _, bound = linebreak_optimized_approximate(words, max_width, measure)
+        ends = linebreak_optimized_bounded(words, max_width, measure, bound)
+    if ends is None:
+        # Short paragraph, or the approximation under-measured: run unbounded.
+        ends = linebreak_optimized_bounded(words, max_width, measure)
+    starts = [0] + ends[:-1]
+    return [" ".join(words[start:end]) for start, end in zip(starts, ends)]
+
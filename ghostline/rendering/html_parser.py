@@ -1,12 +1,14 @@
 """Deterministic HTML parser producing a minimal DOM tree."""
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
-from html.parser import HTMLParser
+from html import unescape
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Minimal DOM node representation with deterministic ordering."""
 
@@ -14,47 +16,136 @@ class Node:
     attributes: Dict[str, str]
     children: List["Node"] = field(default_factory=list)
     text: str = ""
+    # Cached ``len(text.split())`` so layout does not rescan text per pass.
+    word_count: int = field(default=-1, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.word_count < 0:
+            self.word_count = len(self.text.split())
 
     def find(self, tag: str) -> Optional["Node"]:
-        for child in self.children:
-            if child.tag == tag:
-                return child
-            nested = child.find(tag)
-            if nested:
-                return nested
+        """Return the first descendant with ``tag`` in document order."""
+
+        # Explicit stack instead of recursion; children are pushed reversed so
+        # the walk stays depth-first preorder, matching document order.
+        stack = self.children[::-1]
+        while stack:
+            node = stack.pop()
+            if node.tag == tag:
+                return node
+            stack.extend(reversed(node.children))
         return None
 
 
-class DeterministicHTMLParser(HTMLParser):
-    """HTML parser that builds a simplified DOM for layout tests."""
+# One scanner pass over the document. Alternatives, in order: comments,
+# start/end tags (quoted attribute values may contain ">"), declarations and
+# processing instructions, then text. A "<" that opens none of those is text.
+# Quotes only delimit values after "=", matching html.parser's tolerance. The
+# attribute run is possessive so an unterminated tag fails in linear time.
+_TOKEN_RE = re.compile(
+    r"""
+    <!--.*?(?:-->|\Z)
+  | <(?P<closing>/?)(?P<tag>[a-zA-Z][^\t\n\r\f />\x00]*)
+      (?P<attrs>(?:[^>=]|=+\s*(?:"[^"]*"|'[^']*')|=)*+)>
+  | <[!?][^>]*>
+  | (?P<text>[^<]+|<)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_ATTR_RE = re.compile(
+    r"""([^\s/>][^\s/=>]*)(?:\s*=+\s*('[^']*'|"[^"]*"|(?!['"])[^>\s]*))?"""
+)
+# A trailing "/" that belongs to an unquoted value does not self-close the tag.
+_BARE_VALUE_SLASH_RE = re.compile(r"""=\s*(?!['"])[^>\s]*/\Z""")
+# Elements whose content is raw text up to the matching end tag.
+_RAW_TEXT_END = {
+    "script": re.compile(r"</\s*script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</\s*style\s*>", re.IGNORECASE),
+}
+# Tag and attribute names recur across documents; interning shares one string
+# per name and lets tag comparisons in ``Node.find`` hit the identity fast path.
+_intern = sys.intern
+
+
+def _parse_attributes(source: str) -> Dict[str, str]:
+    attributes: Dict[str, str] = {}
+    for match in _ATTR_RE.finditer(source):
+        name, value = match.groups()
+        if value is None:
+            value = ""
+        elif value[:1] == value[-1:] and value[:1] in ("'", '"'):
+            value = value[1:-1]
+        attributes[_intern(name.lower())] = unescape(value)
+    return attributes
+
+
+class DeterministicHTMLParser:
+    """Regex-driven HTML tokenizer that builds a simplified DOM for layout tests.
+
+    Covers the deterministic subset the layout engine consumes: elements,
+    attributes, character references, comments, declarations, and raw-text
+    ``script``/``style`` bodies.
+    """
 
     def __init__(self) -> None:
-        super().__init__()
         self.root = Node(tag="document", attributes={})
         self._stack: List[Node] = [self.root]
 
-    def handle_starttag(self, tag: str, attrs) -> None:  # noqa: D401
-        attribute_map = {key: value or "" for key, value in attrs}
-        node = Node(tag=tag, attributes=attribute_map)
+    def handle_starttag(self, tag: str, attributes: Dict[str, str]) -> None:
+        node = Node(tag=tag, attributes=attributes)
         self._stack[-1].children.append(node)
         self._stack.append(node)
 
-    def handle_endtag(self, tag: str) -> None:  # noqa: D401
+    def handle_endtag(self, tag: str) -> None:
         while self._stack and self._stack[-1].tag != tag:
             self._stack.pop()
         if self._stack and self._stack[-1].tag == tag:
             self._stack.pop()
 
-    def handle_data(self, data: str) -> None:  # noqa: D401
-        if not data.strip():
+    def handle_data(self, data: str) -> None:
+        data = data.strip()
+        if not data:
             return
-        self._stack[-1].text += data.strip()
+        node = self._stack[-1]
+        words = len(data.split())
+        # Chunks are joined without a separator, so the previous last word
+        # and this first word merge into one.
+        node.word_count += words - 1 if node.text else words
+        node.text += data
 
     def parse(self, html: str) -> Node:
         self.root = Node(tag="document", attributes={})
         self._stack = [self.root]
-        self.feed(html)
-        self.close()
+
+        position = 0
+        length = len(html)
+        while position < length:
+            match = _TOKEN_RE.match(html, position)
+            position = match.end()
+            text = match.group("text")
+            if text is not None:
+                self.handle_data(unescape(text))
+                continue
+            tag = match.group("tag")
+            if tag is None:
+                continue  # comment, declaration, or processing instruction
+
+            tag = _intern(tag.lower())
+            if match.group("closing"):
+                self.handle_endtag(tag)
+                continue
+
+            attrs = match.group("attrs")
+            self.handle_starttag(tag, _parse_attributes(attrs))
+            if attrs.endswith("/") and not _BARE_VALUE_SLASH_RE.search(attrs):
+                self.handle_endtag(tag)
+            elif tag in _RAW_TEXT_END:
+                end = _RAW_TEXT_END[tag].search(html, position)
+                if end is None:
+                    break  # unterminated raw text is dropped
+                self.handle_data(html[position:end.start()])
+                self.handle_endtag(tag)
+                position = end.end()
         return self.root
 
 
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+from ._knuth_plass import break_lines
 from .html_parser import Node
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutBox:
     tag: str
     x: int
@@ -17,43 +18,63 @@ class LayoutBox:
     children: List["LayoutBox"]
 
 
+def _text_width(text: str) -> int:
+    return len(text) * 7
+
+
 class LayoutEngine:
     """A tiny layout engine meant for deterministic regression tests."""
 
-    BLOCK_ELEMENTS = {"div", "p", "section", "header", "footer", "main"}
+    BLOCK_ELEMENTS = frozenset({"div", "p", "section", "header", "footer", "main"})
 
-    def __init__(self, viewport_width: int = 800, line_height: int = 18) -> None:
+    def __init__(self, viewport_width: int = 800, line_height: int = 18, wrap_text: bool = False) -> None:
         self.viewport_width = viewport_width
         self.line_height = line_height
+        # Off by default: block height is the one-line-per-word placeholder.
+        # When on, block text is wrapped with optimal-fit line breaking.
+        self.wrap_text = wrap_text
 
     def layout(self, node: Node, origin_x: int = 0, origin_y: int = 0) -> LayoutBox:
-        y_cursor = origin_y
-        children_layout: List[LayoutBox] = []
-
-        for child in node.children:
-            box = self._layout_single(child, origin_x=origin_x, origin_y=y_cursor)
-            children_layout.append(box)
-            y_cursor += box.height
-
-        total_height = y_cursor - origin_y
-        return LayoutBox(tag=node.tag, x=origin_x, y=origin_y, width=self.viewport_width, height=total_height, children=children_layout)
-
-    def _layout_single(self, node: Node, origin_x: int, origin_y: int) -> LayoutBox:
+        """Lay out ``node`` and its subtree with an explicit post-order stack.
+
+        Children stack vertically from their parent's origin; a parent's height
+        is the larger of its own intrinsic height and the stacked children.
+        """
+
+        # Frame: [node, width, intrinsic height, child boxes, next child index, y cursor, origin y]
+        stack: List[list] = [[node, self.viewport_width, 0, [], 0, origin_y, origin_y]]
+        while True:
+            frame = stack[-1]
+            current = frame[0]
+            index = frame[4]
+            if index < len(current.children):
+                child = current.children[index]
+                frame[4] = index + 1
+                width, height = self._intrinsic_size(child)
+                stack.append([child, width, height, [], 0, frame[5], frame[5]])
+                continue
+
+            stack.pop()
+            _, width, height, children, _, y_cursor, box_y = frame
+            # y_cursor already carries the running total of the stacked
+            # children, so the box height needs no second pass over them.
+            if y_cursor - box_y > height:
+                height = y_cursor - box_y
+            box = LayoutBox(tag=current.tag, x=origin_x, y=box_y, width=width, height=height, children=children)
+            if not stack:
+                return box
+            parent = stack[-1]
+            parent[3].append(box)
+            parent[5] += height
+
+    def _intrinsic_size(self, node: Node) -> Tuple[int, int]:
         if node.tag in self.BLOCK_ELEMENTS:
-            width = self.viewport_width
-            height = self.line_height * max(1, len(node.text.split()))
-        else:
-            text_width = len(node.text) * 7
-            width = min(self.viewport_width, text_width or self.viewport_width)
-            height = self.line_height
-
-        children: List[LayoutBox] = []
-        if node.children:
-            child_engine = self.layout(Node(tag=node.tag, attributes=node.attributes, children=node.children, text=node.text), origin_x=origin_x, origin_y=origin_y)
-            children = child_engine.children
-            height = max(height, child_engine.height)
-
-        return LayoutBox(tag=node.tag, x=origin_x, y=origin_y, width=width, height=height, children=children)
+            lines = node.word_count
+            if self.wrap_text and lines:
+                lines = len(break_lines(node.text.split(), self.viewport_width, _text_width))
+            return self.viewport_width, self.line_height * max(1, lines)
+        text_width = _text_width(node.text)
+        return min(self.viewport_width, text_width or self.viewport_width), self.line_height
 
 
 def compute_layout(html_root: Node, viewport_width: int = 800) -> LayoutBox:
@@ -61,17 +82,19 @@ def compute_layout(html_root: Node, viewport_width: int = 800) -> LayoutBox:
     return engine.layout(html_root)
 
 
+_TRANSPARENT_TAGS = frozenset({"document", "main"})
+
+
 def snapshot_layout(box: LayoutBox) -> Dict[str, Dict[str, int]]:
     """Flatten a layout tree to a deterministic snapshot for tests."""
 
     snapshot: Dict[str, Dict[str, int]] = {}
 
     def visit(node: LayoutBox, parent_tag: str) -> None:
+        # Every child of a node shares one key prefix, so build it once.
+        prefix = "" if parent_tag in _TRANSPARENT_TAGS or not parent_tag else parent_tag + "/"
         for child in node.children:
-            transparent = parent_tag in {"document", "main"}
-            prefix = "" if transparent else f"{parent_tag}/" if parent_tag else ""
-            key = f"{prefix}{child.tag}" if prefix or not transparent else child.tag
-
+            key = prefix + child.tag
             if key not in snapshot:
                 snapshot[key] = {"x": child.x, "y": child.y, "width": child.width, "height": child.height}
             visit(child, child.tag)
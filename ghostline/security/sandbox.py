@@ -2,29 +2,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Set
 
 
 @dataclass
 class SandboxProfile:
     name: str
-    allowed_syscalls: List[str] = field(default_factory=list)
-    allowed_paths: List[str] = field(default_factory=list)
+    allowed_syscalls: Set[str] = field(default_factory=set)
+    allowed_paths: Set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. list literals) but store sets for O(1) checks.
+        self.allowed_syscalls = set(self.allowed_syscalls)
+        self.allowed_paths = set(self.allowed_paths)
 
     def ensure_seccomp_minimums(self) -> None:
-        required_syscalls = {"read", "write", "exit", "rt_sigreturn"}
-        for syscall in required_syscalls:
-            if syscall not in self.allowed_syscalls:
-                self.allowed_syscalls.append(syscall)
+        self.allowed_syscalls |= {"read", "write", "exit", "rt_sigreturn"}
 
     def allow_profile_storage(self, profile_dir: str) -> None:
-        if profile_dir not in self.allowed_paths:
-            self.allowed_paths.append(profile_dir)
+        self.allowed_paths.add(profile_dir)
+
+    def to_policy(self) -> Dict[str, List[str]]:
+        """Return the allowlists in sorted order for deterministic policy output."""
+
+        return {
+            "syscalls": sorted(self.allowed_syscalls),
+            "paths": sorted(self.allowed_paths),
+        }
 
 
 DEFAULT_CONTENT_PROFILE = SandboxProfile(
     name="content",
-    allowed_syscalls=["openat", "close", "fstat", "mmap", "munmap"],
-    allowed_paths=["/usr/lib/qt6", "/usr/share/ca-certificates"],
+    allowed_syscalls={"openat", "close", "fstat", "mmap", "munmap"},
+    allowed_paths={"/usr/lib/qt6", "/usr/share/ca-certificates"},
 )
 DEFAULT_CONTENT_PROFILE.ensure_seccomp_minimums()
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import logging
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QUrl, QObject, Signal, Slot
-from PySide6.QtGui import QAction, QIcon, QKeySequence
+from PySide6.QtCore import QMetaObject, QTimer, QUrl, QObject, Signal, Slot
+from PySide6.QtGui import QAction, QIcon, QKeySequence, QTextDocument
 from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QStatusBar, QTabWidget, QWidget, QPushButton, QDialog, QVBoxLayout, QTextEdit
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEngineScript, QWebEngineUrlScheme, QWebEnginePage
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineScript, QWebEngineUrlScheme, QWebEnginePage
 from PySide6.QtWebChannel import QWebChannel
 
 from ghostline.logging_config import configure_logging, startup_banner
@@ -24,20 +26,46 @@ from .components import NavigationBar, SettingsDialog
 
 LOGGER = logging.getLogger(__name__)
 
-
-class KeyboardShortcutsDialog(QDialog):
-    """Dialog displaying keyboard shortcuts for the browser."""
-
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        self.setWindowTitle("Keyboard Shortcuts")
-        self.resize(500, 600)
-
-        layout = QVBoxLayout(self)
-
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        text_edit.setMarkdown("""# Ghostline Browser Shortcuts
+DEFAULT_CONTAINER = sys.intern("default")
+BLANK_URL = "about:blank"
+NEW_TAB_TITLE = "New Tab"
+_HTTPS_SCHEME = "https"
+# Only web navigations count towards the dashboard's per-container origin.
+_RECORDABLE_SCHEMES = frozenset({"http", "https"})
+# Schemes shown with the secure padlock; QUrl keeps schemes lowercase.
+_SECURE_SCHEMES = frozenset({"https", "wss"})
+# Hosts whose compatibility note is kept; the cache is dropped when full.
+ADVISORY_NOTE_CACHE_SIZE = 256
+# Distinct fingerprint scripts kept ready for reinstall.
+FP_SCRIPT_CACHE_SIZE = 32
+# FingerprintInjector.template_key(): (container, origin, uniformity preset, locale).
+_FpScriptKey = tuple[str, str, str, str]
+# Wrap fingerprint scripts to skip sandboxed/special pages like about:blank.
+_FP_GUARD_OPEN = "\nif (window.location.protocol !== 'about:' && window.location.protocol !== 'data:') {\n"
+_FP_GUARD_CLOSE = "\n}\n"
+# Widget property holding a tab's stable id; visual indices shift on close.
+TAB_ID_PROPERTY = "ghostline_tab_id"
+# Trailing-edge throttle for privacy summary refreshes triggered by page loads.
+PRIVACY_SUMMARY_THROTTLE_MS = 250
+# Status-bar marks for allowed/blocked API gates.
+_GATE_MARKS = {True: "✔", False: "✖"}
+_ON_OFF = {True: "On", False: "Off"}
+# Fixed-shape segments of the privacy summary, formatted in one pass each.
+_SUMMARY_HEAD = "  |  ".join((
+    "Mode: %s",
+    "Uniformity: %s",
+    "Entropy: %s bits",
+    "ECH: %s",
+    "HTTPS-Only: %s",
+    "Tor: %s",
+    "Origin: %s",
+    "Noise: canvas Δ%.2f/%.2f/%.2f",
+    "Audio Δ%.2f",
+))
+_SUMMARY_COUNTS = "Extensions: %d  |  Permissions: %d (%s)"
+
+
+_SHORTCUTS_MARKDOWN = """# Ghostline Browser Shortcuts
 
 ## Navigation
 - **Ctrl+L** - Jump to address bar
@@ -60,10 +88,46 @@ class KeyboardShortcutsDialog(QDialog):
 
 ## Other
 - **Ctrl+Q** - Quit browser
-""")
+"""
+
+
+class KeyboardShortcutsDialog(QDialog):
+    """Dialog displaying keyboard shortcuts for the browser."""
+
+    # Parsed once and shared read-only by every dialog; built lazily because
+    # Qt text documents need a running QApplication.
+    _document: QTextDocument | None = None
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Keyboard Shortcuts")
+        self.resize(500, 600)
+        self._built = False
+
+    def showEvent(self, event) -> None:
+        # The widget tree is only needed once the dialog is actually shown
+        if not self._built:
+            self._build()
+            self._built = True
+        super().showEvent(event)
+
+    def _build(self) -> None:
+        layout = QVBoxLayout(self)
+
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.setDocument(self._shared_document())
         layout.addWidget(text_edit)
         self.setLayout(layout)
 
+    @classmethod
+    def _shared_document(cls) -> QTextDocument:
+        if cls._document is None:
+            document = QTextDocument(QApplication.instance())
+            document.setMarkdown(_SHORTCUTS_MARKDOWN)
+            cls._document = document
+        return cls._document
+
 
 class GhostlineWebBridge(QObject):
     """Bridge for JavaScript to communicate with the Ghostline application."""
@@ -110,19 +174,94 @@ def _load_app_icon() -> QIcon:
     return QIcon(str(icon_path))
 
 
+@lru_cache(maxsize=None)
+def _menu_shortcuts() -> dict[str, QKeySequence]:
+    """Resolve the menu key sequences once per process.
+
+    Standard keys resolve against the platform theme, which needs a running
+    QApplication, so this cannot run at import time.
+    """
+    return {
+        "new_tab": QKeySequence("Ctrl+T"),
+        "close_tab": QKeySequence("Ctrl+W"),
+        "new_session": QKeySequence(QKeySequence.New),
+        "quit": QKeySequence(QKeySequence.Quit),
+        "reload": QKeySequence(QKeySequence.Refresh),
+        "back": QKeySequence(QKeySequence.Back),
+        "forward": QKeySequence(QKeySequence.Forward),
+        "settings": QKeySequence(QKeySequence.Preferences),
+    }
+
+
+def _url_origin(url: QUrl) -> str:
+    """Return the scheme://host:port origin of ``url``.
+
+    Host-less URLs (ghostline:, about:, data:) have no shared origin, so each
+    one is keyed by the URL itself minus any fragment.
+    """
+    host = url.host()
+    if not host:
+        return url.toString().split("#", 1)[0]
+    return f"{url.scheme()}://{host}:{url.port(-1)}"
+
+
 def _get_welcome_page_url() -> str:
     """Get the URL for the welcome page."""
     return "ghostline:welcome"
 
 
 class BrowserTab:
-    """Wrapper for a web view tab with associated metadata."""
-
-    def __init__(self, web_view: QWebEngineView, container_name: str, web_channel: QWebChannel | None = None) -> None:
-        self.web_view = web_view
+    """Wrapper for a web view tab with associated metadata.
+
+    The web view is created by ``_realize_tab``; until then, which only lasts
+    while the shared profile is pending, the tab is a blank host widget plus
+    the URL it should load.
+    """
+
+    __slots__ = (
+        "host",
+        "container_name",
+        "url",
+        "web_view",
+        "web_channel",
+        "signal_relay",
+        "connections",
+        "title",
+    )
+
+    def __init__(self, host: QWidget, container_name: str, url: str) -> None:
+        self.host = host
         self.container_name = container_name
-        self.web_channel = web_channel  # Keep reference to prevent garbage collection
-        self.title = "New Tab"
+        self.url = url  # URL to load when the tab is realized
+        self.web_view: QWebEngineView | None = None
+        self.web_channel: QWebChannel | None = None  # Keep reference to prevent garbage collection
+        self.signal_relay: TabSignalRelay | None = None
+        self.connections: list[QMetaObject.Connection] = []  # ours, for targeted disconnect
+        self.title = NEW_TAB_TITLE
+
+
+class TabSignalRelay(QObject):
+    """Forwards one tab's web view signals to the window with the tab bound.
+
+    Replaces per-tab lambdas so each connection targets a decorated slot.
+    """
+
+    def __init__(self, window: "GhostlineWindow", tab_id: int, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._window = window
+        self._tab_id = tab_id
+
+    @Slot(QUrl)
+    def url_changed(self, url: QUrl) -> None:
+        self._window._on_url_changed(self._tab_id, url)
+
+    @Slot(bool)
+    def load_finished(self, ok: bool) -> None:
+        self._window._on_load_finished(self._tab_id, ok)
+
+    @Slot(str)
+    def title_changed(self, title: str) -> None:
+        self._window._on_title_changed(self._tab_id, title)
 
 
 class GhostlineWebPage(QWebEnginePage):
@@ -152,35 +291,24 @@ class GhostlineWindow(QMainWindow):
         self.dashboard = PrivacyDashboard()
         self.compatibility_advisor = StreamingCompatibilityAdvisor()
         self.home_url = home_url
+        self._home_qurl = QUrl(home_url)  # parsed once for the Home button
         self._compatibility_note: str | None = None
+        # Formatted advisory note per host; advisories are fixed per session
+        self._advisory_notes: dict[str | None, str | None] = {}
+        self._last_summary_key: tuple | None = None
 
         # Create web bridge for JavaScript communication
         self.web_bridge = GhostlineWebBridge(self)
 
         # Initialize shared profile for all tabs
-        self.default_container_name = "default"
+        self.default_container_name = DEFAULT_CONTAINER
         container_badge = self.dashboard.ensure_container(self.default_container_name, template="research")
 
-        # Create a temporary web view to set up the shared profile
-        temp_view = QWebEngineView(self)
-        self.shared_profile = temp_view.page().profile()
-
-        # Enable Widevine profile settings (environment was set up in launch())
-        self.widevine_enabled = enable_widevine(self.shared_profile)
-
-        # Set spoofed user agent on profile
-        device = self.dashboard.device_randomizer.randomize(0)
-        ua = unified_user_agent(platform=str(device['platform']) + " x86_64")
-        self.shared_profile.setHttpUserAgent(ua)
-        LOGGER.info("user_agent_set", extra={"user_agent": ua, "platform": device['platform']})
-
-        # Install request interceptor to fix MIME type issues
-        interceptor = MimeTypeFixInterceptor()
-        self.shared_profile.setUrlRequestInterceptor(interceptor)
-
-        # Install custom scheme handler for ghostline:welcome
-        scheme_handler = WelcomePageSchemeHandler(self)
-        self.shared_profile.installUrlSchemeHandler(b"ghostline", scheme_handler)
+        # The shared web profile is set up by _finish_init once the window is
+        # showing; tabs opened before then stay placeholders until it exists.
+        self.shared_profile: QWebEngineProfile | None = None
+        self.widevine_enabled = False
+        self._drm_status = "DRM: Widevine unavailable"
 
         # Initialize tab management
         self.tab_widget = QTabWidget(self)
@@ -194,9 +322,26 @@ class GhostlineWindow(QMainWindow):
         new_tab_btn.clicked.connect(lambda: self._new_tab())
         self.tab_widget.setCornerWidget(new_tab_btn)
 
-        self.tabs: dict[int, BrowserTab] = {}
-        self.tab_counter = 0
-        self.fp_injectors: dict[int, FingerprintInjector] = {}
+        self.tabs: dict[int, BrowserTab] = {}  # keyed by stable tab id, not visual index
+        # Ids of closed tabs are reused so ``self.tabs`` stays dense
+        self._free_tab_ids: list[int] = []
+        self._next_tab_id = 0
+        self.fp_injectors: dict[str, FingerprintInjector] = {}  # one shared injector per container
+        # Wrapped fingerprint sources keyed by _FpScriptKey, LRU-bounded.
+        self._fp_script_cache: OrderedDict[_FpScriptKey, str] = OrderedDict()
+        # Fingerprint scripts live on the shared profile and run in every page,
+        # so tabs with the same key share one installed script.
+        self._fp_scripts: dict[_FpScriptKey, QWebEngineScript] = {}
+        self._fp_script_users: dict[_FpScriptKey, int] = {}
+        self._fp_script_keys: dict[int, _FpScriptKey] = {}
+        # Web channel scripts are identical for every tab and installed once.
+        self._web_channel_scripts: list[QWebEngineScript] = []
+        # Last origin handled per tab, to skip same-origin URL changes.
+        self._tab_origins: dict[int, str] = {}
+        # Latest url/title per tab since the last flush; drained once per
+        # event-loop pass so redirect bursts collapse into one UI update.
+        self._pending_ui: dict[int, dict[str, object]] = {}
+        self._ui_flush_scheduled = False
 
         # Install anti-fingerprinting script injection for default container
         self.fp_injectors[self.default_container_name] = FingerprintInjector(self.dashboard, self.default_container_name)
@@ -222,17 +367,73 @@ class GhostlineWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.setCentralWidget(self.tab_widget)
 
-        # Create the initial tab
-        self._new_tab(home_url)
+        # Pages with many subframes fire loadFinished in bursts; coalesce the
+        # resulting summary refreshes into one per interval.
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(PRIVACY_SUMMARY_THROTTLE_MS)
+        self._summary_timer.timeout.connect(self._refresh_privacy_summary)
+
+        # Web engine and profile setup is the slow part of startup; run it on
+        # the first event-loop pass so the window can paint before it.
+        QTimer.singleShot(0, self._finish_init)
+
+    def _finish_init(self) -> None:
+        """Set up the shared profile, then create the initial tab."""
+        # Create a temporary web view to set up the shared profile
+        temp_view = QWebEngineView(self)
+        self.shared_profile = temp_view.page().profile()
+
+        # Enable Widevine profile settings (environment was set up in launch())
+        self.widevine_enabled = enable_widevine(self.shared_profile)
+        # Widevine availability is fixed for the session; format its status once
+        if self.widevine_enabled:
+            self._drm_status = "DRM: Widevine ready"
+
+        # Set spoofed user agent on profile
+        device = self.dashboard.device_randomizer.randomize(0)
+        ua = unified_user_agent(platform=str(device['platform']) + " x86_64")
+        self.shared_profile.setHttpUserAgent(ua)
+        LOGGER.info("user_agent_set", extra={"user_agent": ua, "platform": device['platform']})
+
+        # Install request interceptor to fix MIME type issues
+        interceptor = MimeTypeFixInterceptor()
+        self.shared_profile.setUrlRequestInterceptor(interceptor)
+
+        # Install custom scheme handler for ghostline:welcome
+        scheme_handler = WelcomePageSchemeHandler(self)
+        self.shared_profile.installUrlSchemeHandler(b"ghostline", scheme_handler)
+
+        # Web channel bootstrap for the welcome page, shared by all tabs
+        self._install_web_channel_scripts()
+
+        # Create the initial tab; placeholders opened while the profile was
+        # pending are realized when first activated
+        self._new_tab(self.home_url)
         self._refresh_privacy_summary()
 
+    def _tab_id_at(self, index: int) -> int | None:
+        """Map a visual tab index to the stable id keying ``self.tabs``.
+
+        Visual indices shift when tabs close, so every tab carries its id as a
+        property on its host widget.
+        """
+        widget = self.tab_widget.widget(index)
+        if widget is None:
+            return None
+        return widget.property(TAB_ID_PROPERTY)
+
     def _get_current_tab(self) -> BrowserTab | None:
         """Get the currently active tab."""
-        index = self.tab_widget.currentIndex()
-        if index >= 0 and index in self.tabs:
-            return self.tabs[index]
-        return None
+        tab_id = self._tab_id_at(self.tab_widget.currentIndex())
+        tab = self.tabs.get(tab_id)
+        if tab is not None and tab.web_view is None:
+            self._realize_tab(tab_id)  # first activation builds the web view
+            if tab.web_view is None:
+                return None  # profile not ready yet; _finish_init realizes it
+        return tab
 
+    @Slot(str)
     def _on_navigate(self, target: str) -> None:
         """Handle navigation in the current tab."""
         current_tab = self._get_current_tab()
@@ -246,23 +447,28 @@ class GhostlineWindow(QMainWindow):
             current_tab.web_view.forward()
             return
 
-        url_text = target
-        if "://" not in url_text:
-            url_text = "https://" + url_text
-        current_tab.web_view.load(QUrl(url_text))
+        # fromUserInput trims, handles IDN, file paths and host:port, and keeps
+        # scheme-only URLs like ghostline:settings or about:blank intact
+        url = QUrl.fromUserInput(target)
+        if url.scheme() == "http" and "://" not in target:
+            url.setScheme(_HTTPS_SCHEME)  # bare hosts default to HTTPS
+        current_tab.web_view.load(url)
 
+    @Slot()
     def _reload_current_tab(self) -> None:
         """Reload the current tab."""
         current_tab = self._get_current_tab()
         if current_tab:
             current_tab.web_view.reload()
 
+    @Slot()
     def _home_current_tab(self) -> None:
         """Load home URL in the current tab."""
         current_tab = self._get_current_tab()
         if current_tab:
-            current_tab.web_view.load(QUrl(self.home_url))
+            current_tab.web_view.load(self._home_qurl)
 
+    @Slot()
     def _close_current_tab(self) -> None:
         """Close the currently active tab."""
         current_index = self.tab_widget.currentIndex()
@@ -270,15 +476,40 @@ class GhostlineWindow(QMainWindow):
             self._close_tab(current_index)
 
     def _new_tab(self, url: str = "ghostline:welcome") -> None:
-        """Create a new tab."""
-        tab_index = self.tab_counter
-        self.tab_counter += 1
+        """Create a new tab and make it current.
+
+        The tab starts as a placeholder host that ``_realize_tab`` fills with
+        the web view, page and scripts. A tab opened while the shared profile
+        is still pending stays a placeholder until it is first activated.
+        """
+        if self._free_tab_ids:
+            tab_id = self._free_tab_ids.pop()
+        else:
+            tab_id = self._next_tab_id
+            self._next_tab_id += 1
 
-        # Create web view with shared profile
-        web_view = QWebEngineView(self)
-        web_view.setPage(web_view.page())
+        host = QWidget(self)
+        host.setProperty(TAB_ID_PROPERTY, tab_id)
+        host_layout = QVBoxLayout(host)
+        host_layout.setContentsMargins(0, 0, 0, 0)
+        self.tabs[tab_id] = BrowserTab(host, self.default_container_name, url)
 
-        # Set up the page with shared profile
+        # Add to tab widget
+        index = self.tab_widget.addTab(host, NEW_TAB_TITLE)
+        self.tab_widget.setCurrentIndex(index)
+        # addTab may already have made this tab current without a switch signal
+        self._realize_tab(tab_id)
+        LOGGER.info("new_tab_created", extra={"tab_id": tab_id, "url": url})
+
+    def _realize_tab(self, tab_id: int) -> None:
+        """Create the web view for a placeholder tab and load its URL."""
+        tab = self.tabs.get(tab_id)
+        if tab is None or tab.web_view is not None or self.shared_profile is None:
+            return
+
+        # Create web view with a page on the shared profile; calling
+        # web_view.page() first would build a default page only to discard it
+        web_view = QWebEngineView(tab.host)
         page = GhostlineWebPage(self.shared_profile, web_view)
         web_view.setPage(page)
 
@@ -287,207 +518,261 @@ class GhostlineWindow(QMainWindow):
         web_channel.registerObject("ghostline", self.web_bridge)
         page.setWebChannel(web_channel)
 
-        # Create tab wrapper (stores web_channel to prevent garbage collection)
-        tab = BrowserTab(web_view, self.default_container_name, web_channel)
-        self.tabs[tab_index] = tab
+        # Keep web_channel on the tab to prevent garbage collection
+        tab.web_view = web_view
+        tab.web_channel = web_channel
+        tab.host.layout().addWidget(web_view)
 
         # Connect signals for this tab
-        web_view.urlChanged.connect(lambda url: self._on_url_changed(tab_index, url))
-        web_view.loadFinished.connect(lambda ok: self._on_load_finished(tab_index, ok))
-        web_view.titleChanged.connect(lambda title: self._on_title_changed(tab_index, title))
+        relay = TabSignalRelay(self, tab_id, web_view)
+        tab.signal_relay = relay
+        tab.connections = [
+            web_view.urlChanged.connect(relay.url_changed),
+            web_view.loadFinished.connect(relay.load_finished),
+            web_view.titleChanged.connect(relay.title_changed),
+        ]
 
         # Install fingerprint protection for this tab
-        self._install_fingerprint_protection_for_tab(tab_index)
-
-        # Install web channel script for welcome page
-        self._install_web_channel_script_for_tab(tab_index)
-
-        # Add to tab widget
-        self.tab_widget.addTab(web_view, "New Tab")
-        self.tab_widget.setCurrentIndex(tab_index)
+        self._install_fingerprint_protection_for_tab(tab_id)
 
         # Load the URL
-        web_view.load(QUrl(url))
-        LOGGER.info("new_tab_created", extra={"tab_index": tab_index, "url": url})
-
-    def _close_tab(self, tab_index: int) -> None:
-        """Close a tab and clean up all associated resources."""
-        if tab_index not in self.tabs:
+        web_view.load(QUrl(tab.url))
+        LOGGER.info("tab_realized", extra={"tab_id": tab_id, "url": tab.url})
+
+    @Slot(int)
+    def _close_tab(self, index: int) -> None:
+        """Close the tab at visual ``index`` and clean up all associated resources."""
+        tab_id = self._tab_id_at(index)
+        if tab_id not in self.tabs:
             return
 
-        tab = self.tabs[tab_index]
-        web_view = tab.web_view
+        tab = self.tabs[tab_id]
 
-        # Disconnect all signals connected to this web view
-        web_view.disconnect()
+        # Disconnect only the connections this window made to the web view
+        for connection in tab.connections:
+            QObject.disconnect(connection)
+        tab.connections.clear()
 
-        # Remove fingerprint protection scripts for this tab
-        profile = self.shared_profile
-        scripts = profile.scripts()
-        script_name = f"ghostline-fingerprint-protection-{tab_index}"
-        scripts_to_remove = [script for script in scripts.toList() if script.name() == script_name]
-        for script in scripts_to_remove:
-            scripts.remove(script)
+        self._tab_origins.pop(tab_id, None)
+        self._pending_ui.pop(tab_id, None)
 
-        # Remove the tab widget
-        self.tab_widget.removeTab(tab_index)
+        # Drop this tab's claim on its fingerprint script; the script itself is
+        # removed once no other tab uses the same (container, origin)
+        fp_key = self._fp_script_keys.pop(tab_id, None)
+        scripts_removed = int(fp_key is not None and self._release_fp_script(fp_key))
 
-        # Remove from tracking
-        del self.tabs[tab_index]
+        # Remove the tab widget; removeTab() does not delete it, so release the
+        # host (and the web view and page it owns) explicitly
+        self.tab_widget.removeTab(index)
+        tab.host.deleteLater()
 
-        LOGGER.info("tab_closed", extra={"tab_index": tab_index, "scripts_removed": len(scripts_to_remove)})
+        # Remove from tracking and recycle the id
+        del self.tabs[tab_id]
+        self._free_tab_ids.append(tab_id)
 
-    def _on_tab_switched(self, tab_index: int) -> None:
+        LOGGER.info("tab_closed", extra={"tab_id": tab_id, "scripts_removed": scripts_removed})
+
+    @Slot(int)
+    def _on_tab_switched(self, index: int) -> None:
         """Handle tab switch event."""
         current_tab = self._get_current_tab()
         if current_tab:
             # Update navigation bar with current tab's URL
             self._update_address_bar(current_tab.web_view.url())
             self._update_security_state(current_tab.web_view.url())
-            LOGGER.info("tab_switched", extra={"tab_index": tab_index})
+            LOGGER.info("tab_switched", extra={"tab_id": self._tab_id_at(index)})
 
-    def _on_url_changed(self, tab_index: int, url: QUrl) -> None:
+    def _on_url_changed(self, tab_id: int, url: QUrl) -> None:
         """Handle URL change in a tab."""
-        if tab_index in self.tabs:
-            tab = self.tabs[tab_index]
-            # Only update UI if this is the active tab
-            if self.tab_widget.currentIndex() == tab_index:
-                self._update_address_bar(url)
-                self._update_security_state(url)
-                self._install_fingerprint_protection_for_tab(tab_index)
-
-    def _on_title_changed(self, tab_index: int, title: str) -> None:
-        """Handle title change in a tab."""
-        if tab_index in self.tabs:
-            self.tabs[tab_index].title = title
-            # Update tab widget title
-            self.tab_widget.setTabText(tab_index, title[:30] if title else "New Tab")
+        if tab_id in self.tabs:
+            self._queue_ui_update(tab_id, "url", QUrl(url))
 
-    def _on_load_finished(self, tab_index: int, ok: bool) -> None:
+    def _on_title_changed(self, tab_id: int, title: str) -> None:
+        """Handle title change in a tab."""
+        if tab_id in self.tabs:
+            self._queue_ui_update(tab_id, "title", title)
+
+    def _queue_ui_update(self, tab_id: int, field: str, value: object) -> None:
+        """Record the latest ``field`` value for a tab and schedule one flush."""
+        self._pending_ui.setdefault(tab_id, {})[field] = value
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_ui)
+
+    @Slot()
+    def _flush_ui(self) -> None:
+        """Apply the coalesced url/title updates: widget reads first, then writes."""
+        self._ui_flush_scheduled = False
+        pending, self._pending_ui = self._pending_ui, {}
+        current_id = self._tab_id_at(self.tab_widget.currentIndex())
+        for tab_id, update in pending.items():
+            tab = self.tabs.get(tab_id)
+            if tab is None:
+                continue  # closed before the flush ran
+            if "title" in update:
+                title = update["title"]
+                tab.title = title
+                index = self.tab_widget.indexOf(tab.host)
+                self.tab_widget.setTabText(index, title[:30] if title else NEW_TAB_TITLE)
+
+            url = update.get("url")
+            # Only the active tab drives the address bar and security state
+            if url is None or tab_id != current_id:
+                continue
+            self._update_address_bar(url)
+            # Fragment and pushState changes keep the origin; the security
+            # state and fingerprint script only depend on the origin.
+            origin = _url_origin(url)
+            if self._tab_origins.get(tab_id) == origin:
+                continue
+            self._tab_origins[tab_id] = origin
+            self._update_security_state(url)
+            self._install_fingerprint_protection_for_tab(tab_id)
+
+    def _on_load_finished(self, tab_id: int, ok: bool) -> None:
         """Handle load finished in a tab."""
-        if tab_index == self.tab_widget.currentIndex():
+        if tab_id == self._tab_id_at(self.tab_widget.currentIndex()):
             message = "Page loaded" if ok else "Failed to load page"
             LOGGER.info("navigation_status", extra={"success": ok, "status_message": message})
-            self._refresh_privacy_summary()
+            self._schedule_privacy_summary()
+
+    def _menu_action(self, text: str, shortcut: QKeySequence, slot) -> QAction:
+        """Create a window-owned action so its shortcut lives as long as the window."""
+        action = QAction(text, self)
+        action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        return action
 
     def _build_menu(self) -> None:
         menu = self.menuBar()
-        file_menu = menu.addMenu("&File")
+        shortcuts = _menu_shortcuts()
 
-        new_tab_action = QAction("New Tab", self)
-        new_tab_action.setShortcut(QKeySequence("Ctrl+T"))
-        new_tab_action.triggered.connect(lambda: self._new_tab())
-        file_menu.addAction(new_tab_action)
-
-        close_tab_action = QAction("Close Tab", self)
-        close_tab_action.setShortcut(QKeySequence("Ctrl+W"))
-        close_tab_action.triggered.connect(self._close_current_tab)
-        file_menu.addAction(close_tab_action)
-
-        new_session_action = QAction("New Session", self)
-        new_session_action.setShortcut(QKeySequence.New)
-        new_session_action.triggered.connect(lambda: self._new_tab("about:blank"))
-        file_menu.addAction(new_session_action)
-        file_menu.addSeparator()
-        quit_action = QAction("Quit", self)
-        quit_action.setShortcut(QKeySequence.Quit)
-        quit_action.triggered.connect(self.close)
-        file_menu.addAction(quit_action)
+        separator = QAction(self)
+        separator.setSeparator(True)
+        file_menu = menu.addMenu("&File")
+        file_menu.addActions([
+            self._menu_action("New Tab", shortcuts["new_tab"], lambda: self._new_tab()),
+            self._menu_action("Close Tab", shortcuts["close_tab"], self._close_current_tab),
+            self._menu_action("New Session", shortcuts["new_session"], lambda: self._new_tab(BLANK_URL)),
+            separator,
+            self._menu_action("Quit", shortcuts["quit"], self.close),
+        ])
 
         view_menu = menu.addMenu("&View")
-        view_menu.addAction("Reload", self._reload_current_tab, QKeySequence.Refresh)
-        view_menu.addAction("Back", lambda: self._on_navigate("back"), QKeySequence.Back)
-        view_menu.addAction(
-            "Forward", lambda: self._on_navigate("forward"), QKeySequence.Forward
-        )
+        view_menu.addActions([
+            self._menu_action("Reload", shortcuts["reload"], self._reload_current_tab),
+            self._menu_action("Back", shortcuts["back"], lambda: self._on_navigate("back")),
+            self._menu_action("Forward", shortcuts["forward"], lambda: self._on_navigate("forward")),
+        ])
 
         tools_menu = menu.addMenu("&Tools")
-        settings_action = QAction("Settings", self)
-        settings_action.setShortcut(QKeySequence.Preferences)
-        settings_action.triggered.connect(self._open_settings)
-        tools_menu.addAction(settings_action)
+        tools_menu.addActions([
+            self._menu_action("Settings", shortcuts["settings"], self._open_settings),
+        ])
 
     def _update_address_bar(self, url: QUrl) -> None:
         self.navigation_bar.set_address(url.toString())
 
     def _update_security_state(self, url: QUrl) -> None:
         host = url.host() or None
-        secure = url.scheme().lower().startswith("https")
+        scheme = url.scheme()
+        secure = scheme in _SECURE_SCHEMES
         self.navigation_bar.update_security_state(secure, host)
-        self.dashboard.record_navigation(self.default_container_name, url.toString())
-
-        advisory = self.compatibility_advisor.advisory_for(host or "")
-        if advisory:
-            self._compatibility_note = (
+        # about:, data:, blob: and internal pages would only overwrite the
+        # recorded origin with a placeholder, so leave the dashboard alone.
+        if host and scheme in _RECORDABLE_SCHEMES:
+            self.dashboard.record_navigation(self.default_container_name, url.toString())
+
+        # Advisories only depend on the host, so format each host's note once
+        try:
+            note = self._advisory_notes[host]
+        except KeyError:
+            advisory = self.compatibility_advisor.advisory_for(host or "")
+            note = (
                 f"{advisory.host}: {advisory.symptom} (error {advisory.error_code}). "
                 f"{advisory.remediation}"
+                if advisory
+                else None
             )
+            if len(self._advisory_notes) >= ADVISORY_NOTE_CACHE_SIZE:
+                self._advisory_notes.clear()
+            self._advisory_notes[host] = note
+        self._compatibility_note = note
+        if LOGGER.isEnabledFor(logging.INFO):
             LOGGER.info("compatibility_note", extra={"note": self._compatibility_note})
-        else:
-            self._compatibility_note = None
-            LOGGER.info("compatibility_note", extra={"note": None})
 
-    def _install_fingerprint_protection_for_tab(self, tab_index: int) -> None:
+    def _install_fingerprint_protection_for_tab(self, tab_id: int) -> None:
         """Install JavaScript that enforces anti-fingerprinting protections for a specific tab."""
-        if tab_index not in self.tabs:
+        if tab_id not in self.tabs:
             return
 
-        tab = self.tabs[tab_index]
-        profile = self.shared_profile
-        scripts = profile.scripts()
-
-        # Remove old fingerprint script if exists for this tab
-        # (we use a unique name per tab)
-        script_name = f"ghostline-fingerprint-protection-{tab_index}"
-        for script in scripts.toList():
-            if script.name() == script_name:
-                scripts.remove(script)
-
-        # Get or create fingerprint injector for this container
+        tab = self.tabs[tab_id]
         container_name = tab.container_name
-        if container_name not in self.fp_injectors:
-            self.fp_injectors[container_name] = FingerprintInjector(self.dashboard, container_name)
-
-        fp_injector = self.fp_injectors[container_name]
-
-        # Generate script for current origin
-        origin = self.dashboard._container_origins.get(container_name, "about:blank")
-        script_source = fp_injector.generate_script(origin)
+        # Get or create fingerprint injector for this container
+        fp_injector = self.fp_injectors.get(container_name)
+        if fp_injector is None:
+            fp_injector = self.fp_injectors[container_name] = FingerprintInjector(self.dashboard, container_name)
+        # The key covers every dashboard input of the compiled template, so a
+        # settings change is never served from the cache.
+        cache_key = fp_injector.template_key()
+        origin = cache_key[1]
+        if self._fp_script_keys.get(tab_id) == cache_key:
+            return  # same container, origin and state: the installed script is current
+
+        old_key = self._fp_script_keys.pop(tab_id, None)
+        if old_key is not None:
+            self._release_fp_script(old_key)
+        self._fp_script_keys[tab_id] = cache_key
+        users = self._fp_script_users.get(cache_key, 0)
+        self._fp_script_users[cache_key] = users + 1
+        if users:
+            return  # another tab already installed this exact script
+
+        wrapped_source = self._fp_script_cache.get(cache_key)
+        if wrapped_source is None:
+            prologue, epilogue = fp_injector.compile_template()
+            # Splice the origin and the special-page guard in one concatenation
+            wrapped_source = _FP_GUARD_OPEN + prologue + origin + epilogue + _FP_GUARD_CLOSE
+            self._fp_script_cache[cache_key] = wrapped_source
+            if len(self._fp_script_cache) > FP_SCRIPT_CACHE_SIZE:
+                self._fp_script_cache.popitem(last=False)
+        else:
+            self._fp_script_cache.move_to_end(cache_key)
 
-        # Create and configure script
+        # Create and configure script, named after the container it protects
         script = QWebEngineScript()
-        script.setName(script_name)
-
-        # Wrap script to skip sandboxed/special pages like about:blank
-        wrapped_source = f"""
-if (window.location.protocol !== 'about:' && window.location.protocol !== 'data:') {{
-{script_source}
-}}
-"""
+        script.setName(f"ghostline-fingerprint-protection-{container_name}")
         script.setSourceCode(wrapped_source)
         script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
         script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
         script.setRunsOnSubFrames(True)
 
-        scripts.insert(script)
-        LOGGER.info("fingerprint_protection_installed", extra={"origin": origin, "container": container_name, "tab_index": tab_index})
-
-    def _install_web_channel_script_for_tab(self, tab_index: int) -> None:
-        """Install a script that sets up the web channel for a specific tab."""
-        if tab_index not in self.tabs:
+        self.shared_profile.scripts().insert(script)
+        self._fp_scripts[cache_key] = script
+        LOGGER.info("fingerprint_protection_installed", extra={"origin": origin, "container": container_name, "tab_id": tab_id})
+
+    def _release_fp_script(self, key: _FpScriptKey) -> bool:
+        """Drop one tab's use of the script for ``key``; return True if it was removed."""
+        users = self._fp_script_users.pop(key, 0) - 1
+        if users > 0:
+            self._fp_script_users[key] = users
+            return False
+        script = self._fp_scripts.pop(key, None)
+        if script is None:
+            return False
+        self.shared_profile.scripts().remove(script)
+        return True
+
+    def _install_web_channel_scripts(self) -> None:
+        """Install the scripts that set up the web channel, once for all tabs."""
+        if self._web_channel_scripts:
             return
 
-        profile = self.shared_profile
-        scripts = profile.scripts()
-
-        # Remove old web channel scripts if they exist for this tab
-        script_name = f"ghostline-web-channel-{tab_index}"
-        qwebchannel_script_name = f"ghostline-qwebchannel-lib-{tab_index}"
-        for script in scripts.toList():
-            if script.name() in (script_name, qwebchannel_script_name):
-                scripts.remove(script)
+        scripts = self.shared_profile.scripts()
+        script_name = "ghostline-web-channel"
+        qwebchannel_script_name = "ghostline-qwebchannel-lib"
 
-        print(f"[WEBCHANNEL] Installing for tab {tab_index}", flush=True)
+        print("[WEBCHANNEL] Installing shared web channel scripts", flush=True)
 
         # First, inject the QWebChannel library at DocumentCreation
         qwebchannel_lib_script = QWebEngineScript()
@@ -506,7 +791,7 @@ if (window.location.protocol !== 'about:' && window.location.protocol !== 'data:
 
         # Add a test script before qwebchannel to see if scripts are executing
         test_script = QWebEngineScript()
-        test_script.setName(f"ghostline-test-{tab_index}")
+        test_script.setName("ghostline-test")
         test_script.setSourceCode("""
 console.log('[GHOSTLINE-DEBUG] Test script executing at DocumentCreation');
 window.__ghostline_test_ran = true;
@@ -579,10 +864,12 @@ console.log('[GHOSTLINE-DEBUG] After qwebchannel: QWebChannel =', typeof QWebCha
         script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
         script.setRunsOnSubFrames(False)
         scripts.insert(script)
+        self._web_channel_scripts = [test_script, qwebchannel_lib_script, script]
         print(f"[WEBCHANNEL] Initialization script injected at DocumentReady", flush=True)
 
-        LOGGER.info("web_channel_script_installed", extra={"tab_index": tab_index})
+        LOGGER.info("web_channel_script_installed", extra={"scripts": len(self._web_channel_scripts)})
 
+    @Slot()
     def _open_settings(self) -> None:
         """Open settings in a new tab."""
         self._new_tab("ghostline:settings")
@@ -597,41 +884,77 @@ console.log('[GHOSTLINE-DEBUG] After qwebchannel: QWebChannel =', typeof QWebCha
         self._new_tab("ghostline:shortcuts")
         LOGGER.info("keyboard_shortcuts_shown")
 
+    def _schedule_privacy_summary(self) -> None:
+        """Refresh the privacy summary at most once per throttle interval."""
+        if not self._summary_timer.isActive():
+            self._summary_timer.start()
+
+    @Slot()
     def _refresh_privacy_summary(self) -> None:
-        summary = self.dashboard.status_for_container(self.default_container_name)
-        gating = self.dashboard.gating_snapshot(self.default_container_name)
-        noise = self.dashboard.calibrated_noise_for(self.default_container_name)
+        # With the status bar hidden the log record is the only consumer;
+        # skip the dashboard walk when nothing would see it.
+        if self.status_bar.isHidden() and not LOGGER.isEnabledFor(logging.INFO):
+            return
+
+        # The dashboard's key covers every input of its snapshot, so an
+        # unchanged label is detected without walking the dashboard.
+        dashboard = self.dashboard
+        summary_key = (
+            dashboard.summary_key(self.default_container_name),
+            self._drm_status,
+            self._compatibility_note,
+        )
+        label_visible = self.status_bar.isVisible()
+        if label_visible and summary_key == self._last_summary_key:
+            return  # the label already shows this state
+
+        snapshot = dashboard.snapshot_for(self.default_container_name)
+        summary = snapshot.summary
+        gating = snapshot.gating
+        noise = snapshot.noise
+        alerts = snapshot.alerts
+        canvas = noise["canvas"]
+        head = (
+            summary["mode"],
+            summary["uniformity"],
+            summary["entropy_bits"],
+            _ON_OFF[bool(summary["ech"])],
+            _ON_OFF[bool(summary["https_only"])],
+            _ON_OFF[bool(summary["tor"])],
+            summary["container_origin"],
+            canvas["r"],
+            canvas["g"],
+            canvas["b"],
+            noise["audio"],
+        )
+        gates = tuple(gating.items())
+        proxy = summary.get("proxy")
+        counts = (
+            len(summary.get("extensions", [])),
+            len(summary.get("permissions", [])),
+            summary.get("policy_mode", "standard"),
+        )
+
         status_parts = [
-            f"Mode: {summary['mode']}",
-            f"Uniformity: {summary['uniformity']}",
-            f"Entropy: {summary['entropy_bits']} bits",
-            f"ECH: {'On' if summary['ech'] else 'Off'}",
-            f"HTTPS-Only: {'On' if summary['https_only'] else 'Off'}",
-            f"Tor: {'On' if summary['tor'] else 'Off'}",
-            f"Origin: {summary['container_origin']}",
-            f"Noise: canvas Δ{noise['canvas']['r']:.2f}/{noise['canvas']['g']:.2f}/{noise['canvas']['b']:.2f}",
-            f"Audio Δ{noise['audio']:.2f}",
-            "Gates: " + ", ".join(f"{api}={'✔' if allowed else '✖'}" for api, allowed in gating.items()),
+            _SUMMARY_HEAD % head,
+            "Gates: " + ", ".join(f"{api}={_GATE_MARKS[allowed]}" for api, allowed in gates),
         ]
-        proxy = summary.get("proxy")
         if proxy:
             status_parts.append(f"Proxy: {proxy}")
-        status_parts.append(f"Extensions: {len(summary.get('extensions', []))}")
-        status_parts.append(
-            f"Permissions: {len(summary.get('permissions', []))} ({summary.get('policy_mode', 'standard')})"
-        )
-        alerts = self.dashboard.sandbox_alerts()
+        status_parts.append(_SUMMARY_COUNTS % counts)
         if alerts:
             status_parts.append(f"Sandbox alerts: {len(alerts)}")
-        if self.widevine_enabled:
-            status_parts.append("DRM: Widevine ready")
-        else:
-            status_parts.append("DRM: Widevine unavailable")
+        status_parts.append(self._drm_status)
         if self._compatibility_note:
             status_parts.append(f"Compat: {self._compatibility_note}")
         status_text = "  |  ".join(status_parts)
         LOGGER.info("privacy_summary", extra={"summary": status_text})
-        self.status_bar_label.clear()
+        # The bar starts hidden and the label is never filled while it is, so
+        # only a visible bar needs a label write. The key is recorded only with
+        # the write, so a bar shown later still gets its first label.
+        if label_visible:
+            self.status_bar_label.setText(status_text)
+            self._last_summary_key = summary_key
 
 
 def launch() -> None:
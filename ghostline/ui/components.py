@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import QSize, Signal
+from PySide6.QtCore import QSize, Signal, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -23,6 +23,11 @@ from PySide6.QtWidgets import (
 
 from ghostline.ui.dashboard import PrivacyDashboard
 
+_SECURE_LABEL = "🔒 Secure"
+_INSECURE_LABEL = "⚠️ Not secure"
+_SECURE_STYLE = "QLabel { padding: 4px 8px; border-radius: 6px; background: #e8f5e9; color: #256029; }"
+_INSECURE_STYLE = "QLabel { padding: 4px 8px; border-radius: 6px; background: #fff3cd; color: #8a6d3b; }"
+
 
 class NavigationBar(QToolBar):
     navigate_requested = Signal(str)
@@ -30,6 +35,14 @@ class NavigationBar(QToolBar):
     home_requested = Signal()
     settings_requested = Signal()
 
+    _ICON_KEYS = (
+        QStyle.SP_ArrowBack,
+        QStyle.SP_ArrowForward,
+        QStyle.SP_BrowserReload,
+        QStyle.SP_DesktopIcon,
+        QStyle.SP_FileDialogDetailedView,
+    )
+
     def __init__(self, parent=None) -> None:
         super().__init__("Navigation", parent)
         self.setMovable(False)
@@ -44,28 +57,29 @@ class NavigationBar(QToolBar):
         self.address_bar.setClearButtonEnabled(True)
         self.address_bar.returnPressed.connect(self._handle_address_bar)
 
-        back_action = QAction(self.style().standardIcon(QStyle.SP_ArrowBack), "Back", self)
-        back_action.triggered.connect(lambda: self.navigate_requested.emit("back"))
+        # Resolve the toolbar icons against the style once
+        style = self.style()
+        icons = {key: style.standardIcon(key) for key in self._ICON_KEYS}
+
+        back_action = QAction(icons[QStyle.SP_ArrowBack], "Back", self)
+        back_action.triggered.connect(self._emit_back)
         self.addAction(back_action)
 
-        forward_action = QAction(
-            self.style().standardIcon(QStyle.SP_ArrowForward), "Forward", self
-        )
-        forward_action.triggered.connect(lambda: self.navigate_requested.emit("forward"))
+        forward_action = QAction(icons[QStyle.SP_ArrowForward], "Forward", self)
+        forward_action.triggered.connect(self._emit_forward)
         self.addAction(forward_action)
 
-        reload_action = QAction(self.style().standardIcon(QStyle.SP_BrowserReload), "Reload", self)
-        reload_action.triggered.connect(self.reload_requested.emit)
+        reload_action = QAction(icons[QStyle.SP_BrowserReload], "Reload", self)
+        # Signal-to-signal connections forward in C++ without a Python hop
+        reload_action.triggered.connect(self.reload_requested)
         self.addAction(reload_action)
 
-        home_action = QAction(self.style().standardIcon(QStyle.SP_DesktopIcon), "Home", self)
-        home_action.triggered.connect(self.home_requested.emit)
+        home_action = QAction(icons[QStyle.SP_DesktopIcon], "Home", self)
+        home_action.triggered.connect(self.home_requested)
         self.addAction(home_action)
 
-        settings_action = QAction(
-            self.style().standardIcon(QStyle.SP_FileDialogDetailedView), "Settings", self
-        )
-        settings_action.triggered.connect(self.settings_requested.emit)
+        settings_action = QAction(icons[QStyle.SP_FileDialogDetailedView], "Settings", self)
+        settings_action.triggered.connect(self.settings_requested)
         self.addAction(settings_action)
 
         spacer = QWidget(self)
@@ -74,10 +88,10 @@ class NavigationBar(QToolBar):
 
         self.addWidget(self.address_bar)
 
-        self.security_indicator = QLabel("🔒 Secure", self)
-        self.security_indicator.setStyleSheet(
-            "QLabel { padding: 4px 8px; border-radius: 6px; background: #e8f5e9; color: #256029; }"
-        )
+        self.security_indicator = QLabel(_SECURE_LABEL, self)
+        self.security_indicator.setStyleSheet(_SECURE_STYLE)
+        # setStyleSheet re-resolves the widget's style, so only restyle on a change
+        self._last_secure = True
         self.addWidget(self.security_indicator)
 
         self.container_chip = QLabel("", self)
@@ -86,6 +100,14 @@ class NavigationBar(QToolBar):
         )
         self.addWidget(self.container_chip)
 
+    @Slot()
+    def _emit_back(self) -> None:
+        self.navigate_requested.emit("back")
+
+    @Slot()
+    def _emit_forward(self) -> None:
+        self.navigate_requested.emit("forward")
+
     def _handle_address_bar(self) -> None:
         text = self.address_bar.text().strip()
         if text:
@@ -95,16 +117,13 @@ class NavigationBar(QToolBar):
         self.address_bar.setText(url)
 
     def update_security_state(self, secure: bool, host: Optional[str]) -> None:
-        if secure:
-            label = "🔒 Secure"
-            style = "QLabel { padding: 4px 8px; border-radius: 6px; background: #e8f5e9; color: #256029; }"
-        else:
-            label = "⚠️ Not secure"
-            style = "QLabel { padding: 4px 8px; border-radius: 6px; background: #fff3cd; color: #8a6d3b; }"
+        label = _SECURE_LABEL if secure else _INSECURE_LABEL
         if host:
             label = f"{label} — {host}"
         self.security_indicator.setText(label)
-        self.security_indicator.setStyleSheet(style)
+        if secure != self._last_secure:
+            self._last_secure = secure
+            self.security_indicator.setStyleSheet(_SECURE_STYLE if secure else _INSECURE_STYLE)
 
     def set_container_badge(self, name: str, color: str, isolation_badge: str) -> None:
         self.container_chip.setText(f"{name} • {isolation_badge}")
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from itertools import cycle
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Tuple
 
 
 PALETTE = ["#4caf50", "#2196f3", "#ff9800", "#9c27b0", "#607d8b"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContainerPolicyBundle:
     """Default policy bundle per container template."""
 
@@ -16,10 +18,55 @@ class ContainerPolicyBundle:
     uniformity_preset: str
     tor_required: bool
     proxy_mode: str
-    notes: List[str] = field(default_factory=list)
-
-
-@dataclass
+    notes: Tuple[str, ...] = ()
+    # Derived once per bundle; every container registered from it shares it.
+    isolation_badge: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "isolation_badge", f"isolated:{self.uniformity_preset}")
+
+
+# Templates are immutable configuration shared by every ContainerUX.
+CONTAINER_TEMPLATES: Mapping[str, ContainerPolicyBundle] = MappingProxyType({
+    "balanced": ContainerPolicyBundle(
+        name="balanced",
+        uniformity_preset="balanced",
+        tor_required=False,
+        proxy_mode="standard",
+        notes=("Fingerprint smoothing", "Proxy optional"),
+    ),
+    "research": ContainerPolicyBundle(
+        name="research",
+        uniformity_preset="strict",
+        tor_required=True,
+        proxy_mode="tor",
+        notes=("Sensitive lookups isolated", "Strict capability mask"),
+    ),
+    "strict": ContainerPolicyBundle(
+        name="strict",
+        uniformity_preset="strict",
+        tor_required=False,
+        proxy_mode="hardened",
+        notes=("Maximum uniformity", "WebGPU blocked"),
+    ),
+    "shopping": ContainerPolicyBundle(
+        name="shopping",
+        uniformity_preset="balanced",
+        tor_required=False,
+        proxy_mode="standard",
+        notes=("Payment friendly", "Balanced entropy budget"),
+    ),
+    "banking": ContainerPolicyBundle(
+        name="banking",
+        uniformity_preset="strict",
+        tor_required=False,
+        proxy_mode="hardened",
+        notes=("Certificates pinned", "Audio/WebGPU blocked"),
+    ),
+})
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class ContainerBadge:
     name: str
     color: str
@@ -31,69 +78,29 @@ class ContainerUX:
     """Tracks container templates, badges, and color coding."""
 
     def __init__(self) -> None:
-        self.templates = self._build_templates()
+        self.templates = CONTAINER_TEMPLATES
         self.badges: Dict[str, ContainerBadge] = {}
-        self._palette_index = 0
-
-    def _build_templates(self) -> Dict[str, ContainerPolicyBundle]:
-        return {
-            "balanced": ContainerPolicyBundle(
-                name="balanced",
-                uniformity_preset="balanced",
-                tor_required=False,
-                proxy_mode="standard",
-                notes=["Fingerprint smoothing", "Proxy optional"],
-            ),
-            "research": ContainerPolicyBundle(
-                name="research",
-                uniformity_preset="strict",
-                tor_required=True,
-                proxy_mode="tor",
-                notes=["Sensitive lookups isolated", "Strict capability mask"],
-            ),
-            "strict": ContainerPolicyBundle(
-                name="strict",
-                uniformity_preset="strict",
-                tor_required=False,
-                proxy_mode="hardened",
-                notes=["Maximum uniformity", "WebGPU blocked"],
-            ),
-            "shopping": ContainerPolicyBundle(
-                name="shopping",
-                uniformity_preset="balanced",
-                tor_required=False,
-                proxy_mode="standard",
-                notes=["Payment friendly", "Balanced entropy budget"],
-            ),
-            "banking": ContainerPolicyBundle(
-                name="banking",
-                uniformity_preset="strict",
-                tor_required=False,
-                proxy_mode="hardened",
-                notes=["Certificates pinned", "Audio/WebGPU blocked"],
-            ),
-        }
+        # Looked up on every navigation; bind dict.get directly instead of
+        # wrapping it in a method. ``badges`` is never rebound.
+        self.badge_for: Callable[[str], ContainerBadge | None] = self.badges.get
+        self._palette = cycle(PALETTE)
 
     def _next_color(self) -> str:
-        color = PALETTE[self._palette_index % len(PALETTE)]
-        self._palette_index += 1
-        return color
+        return next(self._palette)
 
     def register_container(self, name: str, template: str) -> ContainerBadge:
-        if template not in self.templates:
-            raise ValueError(f"unknown-template:{template}")
-        policy = self.templates[template]
+        try:
+            policy = self.templates[template]
+        except KeyError:
+            raise ValueError(f"unknown-template:{template}") from None
         badge = ContainerBadge(
             name=name,
             color=self._next_color(),
             policy=policy,
-            isolation_badge=f"isolated:{policy.uniformity_preset}",
+            isolation_badge=policy.isolation_badge,
         )
         self.badges[name] = badge
         return badge
 
-    def badge_for(self, name: str) -> ContainerBadge | None:
-        return self.badges.get(name)
-
 
 __all__ = ["ContainerUX", "ContainerBadge", "ContainerPolicyBundle"]
@@ -9,8 +9,10 @@ each container.
 """
 from __future__ import annotations
 
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 from urllib.parse import urlsplit
 
 from ghostline.extensions.platform import ExtensionPackage, ExtensionPlatform
@@ -30,12 +32,40 @@ from ghostline.community.publishing import ReleaseCommunicator
 from ghostline.ui.containers import ContainerBadge, ContainerUX
 
 
+# Origin of a container that has not navigated anywhere yet.
+ABOUT_BLANK = "about:blank"
+# Navigations repeat a small set of URLs, so parsed origins are memoized.
+ORIGIN_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=ORIGIN_CACHE_SIZE)
 def _origin_from_url(url: str) -> str:
     parsed = urlsplit(url)
-    return f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else "about:blank"
+    return f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else ABOUT_BLANK
+
+
+@lru_cache(maxsize=ORIGIN_CACHE_SIZE)
+def _bucket_seed(origin: str) -> int:
+    """Device-randomizer window for ``origin``, identical across runs.
+
+    ``hash(str)`` is salted per process, so the same origin used to land in a
+    different bucket after every restart; CRC32 is unsalted and cheaper.
+    """
+
+    return zlib.crc32(origin.encode("utf-8")) % 10_000
 
 
-@dataclass
+@dataclass(frozen=True)
+class PrivacySnapshot:
+    """Status, gating, noise, and sandbox alerts for one container at one moment."""
+
+    summary: Dict[str, str | bool | Dict[str, str | int]]
+    gating: Dict[str, bool]
+    noise: Dict[str, Dict[str, float] | float]
+    alerts: List[str]
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class PrivacyDashboard:
     """Summarizes connection state and exposes quick toggles."""
 
@@ -89,24 +119,48 @@ class PrivacyDashboard:
     def status_for_container(self, container: str) -> Dict[str, str | bool | Dict[str, str | int]]:
         proxy = self.proxy_registry.get(container)
         profile = self.uniformity_manager.profile_for(container)
-        self._container_origins.setdefault(container, "about:blank")
+        origin = self._container_origins.setdefault(container, ABOUT_BLANK)
+        toggles = self.toggles
         last_device = self._last_device_class.get(container, {})
         return {
             "mode": self.connection_mode,
             "proxy": proxy.name if proxy else None,
-            "ech": self.toggles.get("ech", False),
-            "https_only": self.toggles.get("https_only", False),
-            "tor": self.toggles.get("tor", False),
+            "ech": toggles.get("ech", False),
+            "https_only": toggles.get("https_only", False),
+            "tor": toggles.get("tor", False),
             "uniformity": profile.name,
             "entropy_bits": self.entropy_budget.total_bits(),
-            "container_origin": self._container_origins[container],
+            "container_origin": origin,
             "device_class": last_device or {},
             "extensions": self.extension_platform.container_extensions(container),
-            "permissions": self.permission_manager.active_permissions(self._container_origins[container]),
+            "permissions": self.permission_manager.active_permissions(origin),
             "policy_mode": self.permission_policy.compliance_mode,
             "performance_overlays": [overlay.recommendation for overlay in self.performance_monitor.overlays_for(container)],
         }
 
+    def summary_key(self, container: str) -> tuple:
+        """Cheap key that changes whenever the summary of ``snapshot_for(container)`` would.
+
+        Read straight from the underlying state rather than a change counter,
+        so direct field writes (the settings dialog sets ``connection_mode``)
+        are seen too. Gating follows the preset and noise follows the origin.
+        """
+
+        proxy = self.proxy_registry.get(container)
+        origin = self._container_origins.get(container, ABOUT_BLANK)
+        return (
+            self.connection_mode,
+            proxy.name if proxy else None,
+            tuple(self.toggles.items()),
+            self.uniformity_manager.profile_for(container).name,
+            self.entropy_budget.total_bits(),
+            origin,
+            len(self.extension_platform.container_extensions(container)),
+            len(self.permission_manager.active_permissions(origin)),
+            self.permission_policy.compliance_mode,
+            len(self.extension_platform.sandbox.alerts),
+        )
+
     def log_error(self, message: str) -> None:
         self.errors.append(message)
 
@@ -126,17 +180,26 @@ class PrivacyDashboard:
         origin = _origin_from_url(url)
         self._container_origins[container] = origin
         self.entropy_budget.reset()
-        bucket_seed = abs(hash(origin)) % 10_000
-        device = self.device_randomizer.randomize(window_id=bucket_seed)
+        device = self.device_randomizer.randomize(window_id=_bucket_seed(origin))
         self._last_device_class[container] = device
 
+    def origin_for_container(self, container: str) -> str:
+        """Origin of the container's last recorded navigation, or ``about:blank``."""
+
+        return self._container_origins.get(container, ABOUT_BLANK)
+
+    def fingerprint_state_for(self, container: str) -> Tuple[str, str]:
+        """Uniformity preset and locale that shape the container's injected script."""
+
+        return self.uniformity_manager.profile_for(container).name, self._container_locales.get(container, "en-US")
+
     def request_permission(self, container: str, permission: str, prompt: PermissionPrompt) -> bool:
-        origin = self._container_origins.get(container, "about:blank")
+        origin = self.origin_for_container(container)
         grant = self.permission_manager.request_permission(origin, permission, prompt)
         return grant.granted and grant.active
 
     def log_permission_usage(self, container: str, permission: str) -> bool:
-        origin = self._container_origins.get(container, "about:blank")
+        origin = self.origin_for_container(container)
         return self.permission_manager.use_permission(origin, permission)
 
     def auto_revoke_permissions(self) -> None:
@@ -153,15 +216,27 @@ class PrivacyDashboard:
     def sandbox_alerts(self) -> List[str]:
         return list(self.extension_platform.sandbox.alerts)
 
-    def gating_snapshot(self, container: str, apis: List[str] | None = None) -> Dict[str, bool]:
-        apis = apis or list(HIGH_ENTROPY_APIS)
-        snapshot: Dict[str, bool] = {}
-        for api in apis:
-            snapshot[api] = self.uniformity_manager.gate_api(container, api)
-        return snapshot
+    def gating_snapshot(self, container: str, apis: Iterable[str] | None = None) -> Dict[str, bool]:
+        # One profile lookup serves every gate; the frozen API set is iterated
+        # directly rather than copied into a fresh list per call.
+        gate = self.uniformity_manager.profile_for(container).gate_api
+        return {api: gate(api) for api in apis or HIGH_ENTROPY_APIS}
+
+    def snapshot_for(self, container: str) -> PrivacySnapshot:
+        """Gather everything the status summary shows for ``container`` in one call."""
+
+        summary = self.status_for_container(container)
+        return PrivacySnapshot(
+            summary=summary,
+            gating=self.gating_snapshot(container),
+            noise=self._noise_for_origin(summary["container_origin"]),
+            alerts=self.sandbox_alerts(),
+        )
 
     def calibrated_noise_for(self, container: str) -> Dict[str, Dict[str, float] | float]:
-        origin = self._container_origins.get(container, "about:blank")
+        return self._noise_for_origin(self.origin_for_container(container))
+
+    def _noise_for_origin(self, origin: str) -> Dict[str, Dict[str, float] | float]:
         return {
             "canvas": self.noise_calibrator.canvas_noise(origin),
             "audio": self.noise_calibrator.audio_noise(origin),
@@ -176,16 +251,14 @@ class PrivacyDashboard:
         Returns:
             Dictionary with screen dimension properties
         """
-        origin = self._container_origins.get(container, "about:blank")
-        bucket_seed = abs(hash(origin)) % 10_000
-        return self.device_randomizer.screen_dimensions(window_id=bucket_seed)
+        origin = self.origin_for_container(container)
+        return self.device_randomizer.screen_dimensions(window_id=_bucket_seed(origin))
 
     def record_usage_metrics(self, container: str, power_mw: int, cpu_percent: float, bandwidth_kbps: int) -> None:
         self.performance_monitor.record_usage(container, power_mw=power_mw, cpu_percent=cpu_percent, bandwidth_kbps=bandwidth_kbps)
 
     def run_privacy_ci(self, proxy_summary: Dict[str, bool]) -> Dict[str, object]:
-        containers = list(self._container_templates.keys())
-        return self.ci_orchestrator.run(self.uniformity_manager, containers, proxy_summary)
+        return self.ci_orchestrator.run(self.uniformity_manager, self._container_templates.keys(), proxy_summary)
 
     def publish_release_comms(self, version: str, mitigations: List[str]) -> None:
         threat_models = [f"container:{name}" for name in self._container_templates]
@@ -200,4 +273,4 @@ class PrivacyDashboard:
         self.usability_findings.append(f"{topic}:{finding}")
 
 
-__all__ = ["PrivacyDashboard"]
+__all__ = ["PrivacyDashboard", "PrivacySnapshot"]
@@ -1,21 +1,55 @@
 """QtWebEngine request interceptor to block problematic third-party endpoints."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from PySide6.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlSchemeHandler, QWebEngineUrlScheme
 from PySide6.QtCore import QUrl, QByteArray, QBuffer, QIODevice
 
+from ghostline.privacy.host_trie import HostSuffixTrie
+
+MEDIA_DIR = Path(__file__).parent.parent / "media"
+# ghostline: URLs and the media files that back them
+_PAGE_FILES = {
+    "ghostline:welcome": "welcome.html",
+    "ghostline:privacy_dashboard": "privacy_dashboard.html",
+    "ghostline:settings": "settings.html",
+    "ghostline:shortcuts": "shortcuts.html",
+    "ghostline:qwebchannel": "qwebchannel.js",
+}
+# Telemetry domains (and their subdomains) whose CSS-typed fetches are blocked
+_BLOCKED_LOG_HOSTS = HostSuffixTrie([("logs.netflix.com", True)])
+# QByteArray is implicitly shared, so replies reuse these without copying.
+_HTML_MIME = QByteArray(b"text/html; charset=utf-8")
+_JS_MIME = QByteArray(b"text/javascript; charset=utf-8")
+_UNKNOWN_PAGE = QByteArray(b"<html><body>Unknown page</body></html>")
+
+
+@lru_cache(maxsize=None)
+def _read_page(filename: str) -> QByteArray:
+    """Read a bundled media file once per process; pages are static assets."""
+
+    file_path = MEDIA_DIR / filename
+    if file_path.exists():
+        return QByteArray(file_path.read_bytes())
+    # Fallback if file not found
+    return QByteArray(b"/* File not found */")
+
 
 class MimeTypeFixInterceptor(QWebEngineUrlRequestInterceptor):
     """Intercepts web requests and blocks problematic third-party logging endpoints."""
 
     def interceptRequest(self, info):
         """Block Netflix logging endpoints that return invalid MIME types."""
-        url = info.requestUrl().toString()
+        url = info.requestUrl()
+        # Runs for every subresource: settle the common case on the host alone
+        # before converting anything else to a Python string.
+        if url.host() not in _BLOCKED_LOG_HOSTS:
+            return
 
         # Block Netflix logging endpoints that cause MIME type validation errors
         # These are telemetry/logging only and not critical for page functionality
-        if "logs.netflix.com" in url and "fetchType=css" in url:
+        if "fetchType=css" in url.query():
             info.block(True)
 
 
@@ -24,42 +58,20 @@ class WelcomePageSchemeHandler(QWebEngineUrlSchemeHandler):
 
     def requestStarted(self, request):
         """Handle requests for ghostline: URLs."""
-        url = request.requestUrl().toString()
-        media_dir = Path(__file__).parent.parent / "media"
-
-        # Map URLs to filenames
-        url_map = {
-            "ghostline:welcome": "welcome.html",
-            "ghostline:privacy_dashboard": "privacy_dashboard.html",
-            "ghostline:settings": "settings.html",
-            "ghostline:shortcuts": "shortcuts.html",
-            "ghostline:qwebchannel": "qwebchannel.js",
-        }
-
-        filename = url_map.get(url)
-        mime_type = b"text/html; charset=utf-8"
+        filename = _PAGE_FILES.get(request.requestUrl().toString())
 
         if filename:
             # Determine MIME type based on file extension
-            if filename.endswith(".js"):
-                mime_type = b"text/javascript; charset=utf-8"
-
-            file_path = media_dir / filename
-            if file_path.exists():
-                content = file_path.read_bytes()
-            else:
-                # Fallback if file not found
-                content = b"/* File not found */"
-
-            # Use QBuffer to serve the content
-            buffer = QBuffer(self)
-            buffer.setData(QByteArray(content))
-            buffer.open(QIODevice.ReadOnly)
-            request.reply(mime_type, buffer)
+            mime_type = _JS_MIME if filename.endswith(".js") else _HTML_MIME
+            content = _read_page(filename)
         else:
             # Unknown ghostline: URL
-            content = b"<html><body>Unknown page</body></html>"
-            buffer = QBuffer(self)
-            buffer.setData(QByteArray(content))
-            buffer.open(QIODevice.ReadOnly)
-            request.reply(b"text/html; charset=utf-8", buffer)
+            mime_type = _HTML_MIME
+            content = _UNKNOWN_PAGE
+
+        # Use QBuffer to serve the content; parenting it to the request frees
+        # it with the request instead of accumulating on the handler
+        buffer = QBuffer(request)
+        buffer.setData(content)
+        buffer.open(QIODevice.ReadOnly)
+        request.reply(mime_type, buffer)
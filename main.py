@@ -2,18 +2,33 @@
 
 import ctypes.util
 import importlib.util
+import os
 import sys
 
+# Set once the dependency probe has passed; find_library("GL") can shell out
+# to ldconfig/gcc, so it should not run more than once per process.
+_UI_CHECKED = False
+
+
+def _needs_gl_probe() -> bool:
+    # macOS ships OpenGL as a framework find_library("GL") does not report, and
+    # the offscreen platform never opens a display.
+    return sys.platform != "darwin" and os.environ.get("QT_QPA_PLATFORM") != "offscreen"
+
 
 def ensure_ui_requirements() -> None:
     """Validate that graphical dependencies are available before launching."""
 
+    global _UI_CHECKED
+    if _UI_CHECKED:
+        return
+
     missing = []
 
     if importlib.util.find_spec("PySide6") is None:
         missing.append("PySide6 (install via `pip install -r requirements.txt`)")
 
-    if ctypes.util.find_library("GL") is None:
+    if _needs_gl_probe() and ctypes.util.find_library("GL") is None:
         missing.append("libGL (install your platform's OpenGL drivers)")
 
     if missing:
@@ -25,6 +40,8 @@ def ensure_ui_requirements() -> None:
         )
         sys.exit(1)
 
+    _UI_CHECKED = True
+
 
 def main() -> None:
     """Launch the Ghostline Browser UI after verifying dependencies."""
@@ -1,4 +1,5 @@
 from ghostline.privacy.compatibility import CompatibilityAdvisory, StreamingCompatibilityAdvisor
+from ghostline.privacy.host_trie import HostSuffixTrie
 
 
 def test_netflix_advisory_matches_domains_and_subdomains():
@@ -19,3 +20,25 @@ def test_custom_advisories_can_be_injected():
     advisor = StreamingCompatibilityAdvisor([advisory])
     assert advisor.advisory_for("drm.example") == advisory
     assert advisor.advisory_for("unknown.test") is None
+
+
+def test_host_suffix_trie_matches_domains_in_insertion_order():
+    trie = HostSuffixTrie([("netflix.com", "broad"), ("assets.netflix.com", "narrow"), ("drm.example", "x")])
+    assert trie.match("netflix.com") == "broad"
+    assert trie.match("cdn.assets.netflix.com") == "broad"
+    assert trie.match("drm.example") == "x"
+    assert trie.match("notnetflix.com") is None
+    assert trie.match("com") is None
+    assert "a.drm.example" in trie
+    assert "example" not in trie
+
+    trie.insert("netflix.com", "ignored")
+    assert trie.match("netflix.com") == "broad"
+    assert len(trie) == 3
+
+
+def test_advisor_keeps_first_match_order():
+    broad = CompatibilityAdvisory(host="example.com", error_code="A", symptom="s", remediation="r")
+    narrow = CompatibilityAdvisory(host="video.example.com", error_code="B", symptom="s", remediation="r")
+    assert StreamingCompatibilityAdvisor([narrow, broad]).advisory_for("video.example.com") == narrow
+    assert StreamingCompatibilityAdvisor([broad, narrow]).advisory_for("video.example.com") == broad
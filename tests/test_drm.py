@@ -6,6 +6,13 @@ os.environ.setdefault("GHOSTLINE_FAKE_QT", "1")
 from ghostline.media import drm
 
 
+@pytest.fixture(autouse=True)
+def _fresh_widevine_scan():
+    drm._scan_search_roots.cache_clear()
+    yield
+    drm._scan_search_roots.cache_clear()
+
+
 class DummySettings:
     def __init__(self):
         self.attributes = {}
@@ -41,6 +48,12 @@ def test_find_widevine_library_scans_search_roots(tmp_path, monkeypatch):
     discovered = drm.find_widevine_library([])
     assert discovered == str(library)
 
+    # The walk result is reused for the same roots, even after the file moves.
+    library.rename(nested / "moved.so")
+    assert drm.find_widevine_library([]) == str(library)
+    drm._scan_search_roots.cache_clear()
+    assert drm.find_widevine_library([]) is None
+
 
 def test_enable_widevine_sets_flags_and_settings(tmp_path, monkeypatch):
     library = tmp_path / "libwidevinecdm.so"
@@ -1,4 +1,6 @@
 """Tests for anti-fingerprinting JavaScript injection."""
+import zlib
+
 import pytest
 
 from ghostline.privacy.injector import (
@@ -76,8 +78,8 @@ def test_canvas_noise_generator_produces_valid_javascript():
     assert '-0.08' in js_code
     assert '0.12' in js_code
     assert '0.03' in js_code
-    assert 'Math.max' in js_code  # Clamping
-    assert 'Math.min' in js_code
+    assert 'v < 0 ? 0 : (v > 255 ? 255 : v)' in js_code  # Inline clamping
+    assert 'Math.max' not in js_code
 
 
 def test_webgl_spoof_generator_produces_valid_javascript():
@@ -318,6 +320,36 @@ def test_fingerprint_injector_different_per_origin():
     assert 'GHOSTLINE BROWSER' in script2
 
 
+def test_fingerprint_injector_compiled_template_splices_origin():
+    """Test that the compiled template only leaves the origin slot open."""
+    dashboard = PrivacyDashboard()
+    dashboard.ensure_container("test", template="research")
+    dashboard.record_navigation("test", "https://example.com")
+
+    injector = FingerprintInjector(dashboard, "test")
+    prologue, epilogue = injector.compile_template()
+
+    assert prologue + "https://example.com" + epilogue == injector.generate_script("https://example.com")
+    assert prologue.endswith("| Origin: ")
+    assert "https://example.com" not in epilogue
+
+
+def test_fingerprint_injector_template_key_tracks_preset_changes():
+    """Test that a preset change yields a new template key and template."""
+    dashboard = PrivacyDashboard()
+    dashboard.ensure_container("test", template="shopping")
+    dashboard.record_navigation("test", "https://example.com")
+
+    injector = FingerprintInjector(dashboard, "test")
+    key = injector.template_key()
+    assert key == ("test", "https://example.com", "balanced", "en-US")
+    template = injector.compile_template()
+
+    dashboard.set_uniformity("test", "strict")
+    assert injector.template_key() != key
+    assert injector.compile_template() != template
+
+
 def test_fingerprint_injector_updates_device_class_on_navigation():
     """Test that device class is randomized on navigation."""
     dashboard = PrivacyDashboard()
@@ -568,6 +600,9 @@ def test_dashboard_provides_screen_dimensions():
     assert 'height' in screen
     assert screen['width'] > 0
     assert screen['height'] > 0
+    # The origin bucket is unsalted, so it is the same in every process.
+    bucket = zlib.crc32(b"https://example.com") % 10_000
+    assert screen == dashboard.device_randomizer.screen_dimensions(window_id=bucket)
 
 
 def test_dashboard_stores_container_locales():
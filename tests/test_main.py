@@ -6,6 +6,9 @@ import main
 
 
 def test_ensure_ui_requirements_missing(monkeypatch, capsys):
+    monkeypatch.setattr(main, "_UI_CHECKED", False)
+    monkeypatch.setattr(main.sys, "platform", "linux")
+    monkeypatch.delenv("QT_QPA_PLATFORM", raising=False)
     monkeypatch.setattr(main.importlib.util, "find_spec", lambda name: None)
     monkeypatch.setattr(main.ctypes.util, "find_library", lambda name: None)
 
@@ -19,7 +22,21 @@ def test_ensure_ui_requirements_missing(monkeypatch, capsys):
 
 
 def test_ensure_ui_requirements_present(monkeypatch):
+    monkeypatch.setattr(main, "_UI_CHECKED", False)
     monkeypatch.setattr(main.importlib.util, "find_spec", lambda name: object())
     monkeypatch.setattr(main.ctypes.util, "find_library", lambda name: "/usr/lib/libGL.so")
 
     main.ensure_ui_requirements()
+
+    # A passed check is remembered, so later calls do not probe again.
+    monkeypatch.setattr(main.importlib.util, "find_spec", lambda name: None)
+    main.ensure_ui_requirements()
+
+
+def test_ensure_ui_requirements_skips_gl_probe_offscreen(monkeypatch):
+    monkeypatch.setattr(main, "_UI_CHECKED", False)
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    monkeypatch.setattr(main.importlib.util, "find_spec", lambda name: object())
+    monkeypatch.setattr(main.ctypes.util, "find_library", lambda name: None)
+
+    main.ensure_ui_requirements()
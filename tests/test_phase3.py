@@ -2,7 +2,7 @@ import pytest
 
 from ghostline.privacy.audit import ExternalTestbedIntegration, FingerprintingAuditSuite, PrivacyScorecard
 from ghostline.privacy.entropy import DeviceRandomizer, EntropyBudget, NoiseCalibrator
-from ghostline.privacy.uniformity import HIGH_ENTROPY_APIS, UniformityManager
+from ghostline.privacy.uniformity import HIGH_ENTROPY_APIS, FontPack, UniformityManager, UniformityProfile
 from ghostline.ui.containers import ContainerUX
 from ghostline.ui.dashboard import PrivacyDashboard
 
@@ -22,6 +22,17 @@ def test_uniformity_presets_gate_high_entropy_and_fonts():
     assert manager.fonts_for("beta", "fr-FR")[0] == "Inter"
 
 
+def test_apply_preset_shares_frozen_preset_data():
+    manager = UniformityManager()
+    profile = manager.apply_preset("alpha", "strict", locale="de-DE")
+
+    assert profile.capability_mask is manager.presets["strict"].capability_mask
+    with pytest.raises(TypeError):
+        profile.capability_mask["webgl"] = True
+    assert manager.fonts_for("alpha", "de-DE") == manager.fonts_for("alpha", "default")
+    assert "de-DE" not in manager.presets["strict"].font_pack.locales
+
+
 def test_entropy_budget_and_device_randomization():
     budget = EntropyBudget(limit_bits=8)
     assert budget.consume("canvas", 3)
@@ -75,9 +86,13 @@ def test_container_ux_templates_and_badges():
     shopping = ux.register_container("shopping-tab", "shopping")
     assert shopping.policy.uniformity_preset == "balanced"
     assert ux.badge_for("research-tab").isolation_badge.startswith("isolated")
+    assert ux.badge_for("missing") is None
+    assert ContainerUX().templates["research"] is badge.policy
 
     with pytest.raises(ValueError):
         ux.register_container("unknown", "invalid")
+    with pytest.raises(TypeError):
+        ux.templates["custom"] = badge.policy
 
 
 def test_dashboard_integrates_phase3_controls():
@@ -89,8 +104,40 @@ def test_dashboard_integrates_phase3_controls():
     summary = dashboard.status_for_container("alpha")
     assert summary["uniformity"] == "balanced"
     assert "example.com" in summary["container_origin"]
+    assert dashboard.origin_for_container("alpha") == "https://example.com"
+    assert dashboard.origin_for_container("unknown") == "about:blank"
+    assert dashboard.fingerprint_state_for("alpha") == ("balanced", "fr-FR")
+    dashboard.set_uniformity("alpha", "strict")
+    assert dashboard.fingerprint_state_for("alpha") == ("strict", "fr-FR")
+    dashboard.set_uniformity("alpha", "balanced")
 
     gates = dashboard.gating_snapshot("alpha", apis=["webgl", "webgpu"])
     assert "webgl" in gates
     noise = dashboard.calibrated_noise_for("alpha")
     assert "canvas" in noise and "audio" in noise
+
+    snapshot = dashboard.snapshot_for("alpha")
+    assert snapshot.summary == summary
+    assert snapshot.gating == dashboard.gating_snapshot("alpha")
+    assert snapshot.noise == noise
+    assert snapshot.alerts == dashboard.sandbox_alerts()
+
+    key = dashboard.summary_key("alpha")
+    assert dashboard.summary_key("alpha") == key
+    dashboard.connection_mode = "tor"
+    assert dashboard.summary_key("alpha") != key
+    dashboard.connection_mode = "standard"
+    dashboard.record_navigation("alpha", "https://example.org/next")
+    assert dashboard.summary_key("alpha") != key
+
+
+def test_uniformity_profile_gating_folds_strict_mode_and_mask():
+    fonts = FontPack(name="test", locales={"default": ["Inter"]})
+    strict = UniformityProfile(name="s", capability_mask={}, font_pack=fonts, strict_mode=True)
+    masked = UniformityProfile(name="m", capability_mask={"webgl": False, "sensors": False}, font_pack=fonts)
+
+    assert all(strict.gate_api(api) is False for api in HIGH_ENTROPY_APIS)
+    assert strict.gate_api("clipboard") is True
+    assert masked.gate_api("webgl") is False
+    assert masked.gate_api("sensors") is False
+    assert masked.gate_api("webgpu") is True
@@ -1,5 +1,6 @@
 from ghostline.privacy.rfp import CanvasNoiseInjector, rounded_time, unified_user_agent
 from ghostline.privacy.storage import PartitionedStore
+from ghostline.security.sandbox import DEFAULT_CONTENT_PROFILE, SandboxProfile
 
 
 def test_timer_rounding_is_bucketed():
@@ -23,3 +24,15 @@ def test_partitioned_store_isolation():
 def test_unified_user_agent_freezes_platform():
     ua = unified_user_agent(platform="Test Platform")
     assert "Test Platform" in ua
+
+
+def test_sandbox_profile_allowlists_are_deduplicated_and_sorted():
+    profile = SandboxProfile(name="utility", allowed_syscalls=["write", "openat"], allowed_paths=["/tmp"])
+    profile.ensure_seccomp_minimums()
+    profile.ensure_seccomp_minimums()
+    profile.allow_profile_storage("/tmp")
+
+    policy = profile.to_policy()
+    assert policy["syscalls"] == ["exit", "openat", "read", "rt_sigreturn", "write"]
+    assert policy["paths"] == ["/tmp"]
+    assert "rt_sigreturn" in DEFAULT_CONTENT_PROFILE.allowed_syscalls
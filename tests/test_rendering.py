@@ -1,5 +1,6 @@
-from ghostline.rendering.html_parser import parse_html
-from ghostline.rendering.layout import compute_layout, snapshot_layout
+from ghostline.rendering._knuth_plass import break_lines, linebreak_optimized_bounded
+from ghostline.rendering.html_parser import Node, parse_html
+from ghostline.rendering.layout import LayoutEngine, compute_layout, snapshot_layout
 
 
 def test_block_and_inline_layout_deterministic():
@@ -30,3 +31,80 @@ def test_nested_children_snapshotting():
     snapshot = snapshot_layout(layout)
     assert "div/p" in snapshot
     assert snapshot["div/p"]["y"] == 0
+
+
+def test_layout_handles_deep_trees_without_recursion():
+    root = Node(tag="document", attributes={})
+    parent = root
+    for _ in range(5000):
+        child = Node(tag="div", attributes={}, text="word")
+        parent.children.append(child)
+        parent = child
+
+    layout = compute_layout(root)
+    assert layout.height == 18
+    deepest = layout
+    while deepest.children:
+        deepest = deepest.children[0]
+    assert deepest.y == 0
+    assert deepest.height == 18
+
+
+def test_find_walks_document_order_iteratively():
+    dom = parse_html("<div><section><p>deep</p></section></div><p>shallow</p>")
+    assert dom.find("p").text == "deep"
+    assert dom.find("table") is None
+
+    root = Node(tag="document", attributes={})
+    parent = root
+    for _ in range(5000):
+        child = Node(tag="div", attributes={})
+        parent.children.append(child)
+        parent = child
+    parent.children.append(Node(tag="span", attributes={}, text="leaf"))
+    assert root.find("span").text == "leaf"
+
+
+def test_optimal_fit_line_breaking():
+    def measure(text):
+        return len(text) * 7
+
+    # Greedy first-fit would leave "aaa bb" / "cc" / "ddddd"; optimal fit evens it out.
+    assert break_lines("aaa bb cc ddddd".split(), 6 * 7, measure) == ["aaa", "bb cc", "ddddd"]
+
+    words = [("lorem", "ipsum", "dolor", "sit", "amet", "consectetur")[i % 6] for i in range(300)]
+    lines = break_lines(words, 280, measure)
+    assert " ".join(lines) == " ".join(words)
+    assert all(measure(line) <= 280 for line in lines)
+    ends = linebreak_optimized_bounded(words, 280, measure)
+    assert [len(line.split()) for line in lines] == [end - start for start, end in zip([0] + ends[:-1], ends)]
+
+    dom = parse_html(f"<div>{' '.join(words)}</div>")
+    wrapped = LayoutEngine(viewport_width=280, wrap_text=True).layout(dom)
+    assert wrapped.children[0].height == 18 * len(lines)
+    assert LayoutEngine(viewport_width=280).layout(dom).children[0].height == 18 * 300
+
+
+def test_parser_caches_word_count_across_text_chunks():
+    dom = parse_html("<div>one two<span>x</span>three four</div>")
+    div = dom.find("div")
+    assert div.text == "one twothree four"
+    assert div.word_count == len(div.text.split()) == 3
+    assert Node(tag="p", attributes={}, text="a b c").word_count == 3
+
+
+def test_tokenizer_handles_markup_subset():
+    html = """<!DOCTYPE html>
+    <!-- <div>ignored</div> -->
+    <DIV Class="a>b" data-flag>Fish &amp; chips<br/>
+        <script>if (a < b) { x = '</div>'; }</script>
+        <img src=logo.png />
+    </div>"""
+    dom = parse_html(html)
+    div = dom.find("div")
+    assert [child.tag for child in dom.children] == ["div"]
+    assert div.attributes == {"class": "a>b", "data-flag": ""}
+    assert div.text == "Fish & chips"
+    assert [child.tag for child in div.children] == ["br", "script", "img"]
+    assert div.find("script").text == "if (a < b) { x = '</div>'; }"
+    assert div.find("img").attributes == {"src": "logo.png"}